@@ -7,8 +7,6 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import numpy as np
 import os
 import sys
 from issa_theme import ISSATheme  # Keep this one
@@ -28,7 +26,7 @@ except ImportError as e:
     PM_METRICS = {}
 
 try:
-    from hbcu_metrics_integration import HBCUMetricsIntegrator, integrate_hbcu_metrics_into_persona
+    from hbcu_metrics_integration import HBCUMetricsIntegrator, get_hbcu_integrator, integrate_hbcu_metrics_into_persona
     HBCU_INTEGRATION_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import HBCU integration: {e}")
@@ -36,22 +34,20 @@ except ImportError as e:
     
 print(f"HBCU_INTEGRATION_AVAILABLE: {HBCU_INTEGRATION_AVAILABLE}")
 
-# Page configuration
-st.set_page_config(
+# Page configuration and ISSA theme
+ISSATheme.init_app(
     page_title="PQC IT Analytics Suite - Fully Integrated",
     page_icon="🎓",
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
-ISSATheme.apply_theme()
-
 
 # ============================================================================
 # ENHANCED CSS STYLING - Add near top of file after imports
 # ============================================================================
 
-st.markdown("""
+DASHBOARD_CSS = """
     <style>
     /* Global Improvements */
     .main-header {
@@ -210,7 +206,15 @@ st.markdown("""
         margin-left: 0.5rem;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def get_dashboard_css():
+    """Whitespace-collapsed dashboard CSS, built once per server process"""
+    return " ".join(DASHBOARD_CSS.split())
+
+# Streamlit drops elements that are not re-emitted, so the style block is sent every run
+st.markdown(get_dashboard_css(), unsafe_allow_html=True)
 
 
 # Initialize session state
@@ -220,11 +224,84 @@ if 'current_persona' not in st.session_state:
 if 'metrics_loaded' not in st.session_state:
     st.session_state.metrics_loaded = False
     
-# Initialize HBCU integrator
-if HBCU_INTEGRATION_AVAILABLE:
-    hbcu_integrator = HBCUMetricsIntegrator()
-else:
-    hbcu_integrator = None
+# Initialize HBCU integrator - shared across sessions so the HBCU CSVs are read once per process
+hbcu_integrator = get_hbcu_integrator() if HBCU_INTEGRATION_AVAILABLE else None
+
+# Personas backed by the metric registry
+REGISTRY_PERSONAS = frozenset(('cfo', 'cio', 'cto'))
+
+# PM metrics exposed by the PM metric module
+PM_METRIC_SET = frozenset(PM_METRICS.keys()) if PM_METRICS_AVAILABLE else frozenset()
+
+# Persona selector label -> persona key
+PERSONA_KEY_MAP = {
+    "CFO - Financial Steward": "cfo",
+    "CIO - Strategic Partner": "cio",
+    "CTO - Technology Operator": "cto",
+    "Project Manager View": "pm",
+    "HBCU Institutional View": "hbcu"
+}
+
+# Tab layout per persona: (tab name, metrics shown in that tab)
+TAB_CONFIG_CFO = (
+    ("📊 Budget Analysis", ("cfo_budget_vs_actual", "cfo_total_it_spend_breakdown")),
+    ("📃 Contract Intelligence", ("cfo_contract_expiration_alerts", "cfo_vendor_spend_optimization")),
+    ("🤖 AI Optimization", ()),  # NEW AI TAB
+    ("🏛️ Grant & Compliance", ("cfo_grant_compliance",)),
+    ("📈 ROI & Benchmarking", ("cfo_student_success_roi", "cfo_hbcu_peer_benchmarking")),
+    ("📋 Executive Summary", ())
+)
+
+TAB_CONFIG_CIO = (
+    ("🎯 Strategic Portfolio", ("digital_transformation_metrics", "strategic_alignment_metrics")),
+    ("💼 Business Analysis", ("business_unit_it_spend", "app_cost_analysis_metrics")),
+    ("🤖 AI Strategy", ()),  # NEW AI STRATEGY TAB
+    ("⚠️ Risk & Vendor Management", ("risk_metrics", "vendor_metrics")),
+    ("📈 Performance Dashboard", ("project_performance", "innovation_metrics")),
+    ("📋 Executive Brief", ())
+)
+
+TAB_CONFIG_CTO = (
+    ("🖥️ Infrastructure & Performance", ("infrastructure_performance_metrics", "system_utilization_metrics")),
+    ("☁️ Cloud & Asset Management", ("cloud_cost_optimization_metrics", "asset_lifecycle_management_metrics")),
+    ("🤖 AI Operations", ()),  # NEW AI OPERATIONS TAB
+    ("🔒 Security & Compliance", ("security_metrics_and_response", "compliance_monitoring")),
+    ("⚡ Automation & Efficiency", ("automation_metrics", "technical_debt_metrics")),
+    ("📋 Operations Summary", ())
+)
+
+TAB_CONFIG_PM = (
+    ("📊 Portfolio Dashboard", ("project_portfolio_dashboard_metrics", "project_charter_metrics")),
+    ("⏰ Timeline & Budget", ("project_timeline_budget_performance",)),
+    ("📋 Requirements & RAID", ("requirements_traceability_matrix", "raid_log_metrics")),
+    ("🤖 AI Project Intelligence", ()),  # NEW AI TAB
+    ("👥 Resources & Communication", ("resource_allocation_metrics", "stakeholder_communication_metrics")),
+    ("📈 Executive Summary", ())
+)
+
+TAB_NAMES_CFO = tuple(name for name, _ in TAB_CONFIG_CFO)
+TAB_NAMES_CIO = tuple(name for name, _ in TAB_CONFIG_CIO)
+TAB_NAMES_CTO = tuple(name for name, _ in TAB_CONFIG_CTO)
+TAB_NAMES_PM = tuple(name for name, _ in TAB_CONFIG_PM)
+
+@st.cache_data(show_spinner=False)
+def get_available_metrics_cached(persona_name):
+    """Cached set of available metrics for a persona - cleared by the Refresh Data button"""
+    return frozenset(metric_registry.get_available_metrics(persona_name))
+
+@st.cache_data(show_spinner=False)
+def get_persona_metric_counts():
+    """Cached metric counts for the registry personas - cleared by the Refresh Data button"""
+    return {p: len(metric_registry.get_available_metrics(p)) for p in ('cfo', 'cio', 'cto')}
+
+@st.cache_data(show_spinner=False)
+def get_metric_source_flags(persona_name):
+    """Cached (metric, has data, has module, has script) rows for the debug panel"""
+    rows = []
+    for metric in metric_registry.get_available_metrics(persona_name):
+        info = metric_registry.get_metric_info(persona_name, metric)
+        rows.append((metric, bool(info['data_path']), bool(info['module_path']), bool(info['script_path'])))
+    return tuple(rows)
 
 
 
@@ -243,17 +320,11 @@ st.sidebar.markdown("### 📈 Executive Summary")
 # Dynamic metrics based on current persona
 persona = st.sidebar.selectbox(
     "Select Persona View",
-    [
-        "CFO - Financial Steward", 
-        "CIO - Strategic Partner", 
-        "CTO - Technology Operator", 
-        "Project Manager View",
-        "HBCU Institutional View"
-    ]
+    list(PERSONA_KEY_MAP)
 )
 
 # Extract persona key
-persona_key = persona.split(' - ')[0].lower()
+persona_key = PERSONA_KEY_MAP[persona]
 
 # Show key metrics for current persona
 if persona.startswith("CFO"):
@@ -281,6 +352,11 @@ with col1:
         
 with col2:
     if st.button("🔄 Refresh Data", width='stretch'):
+        if METRICS_AVAILABLE:
+            metric_registry._discover_metrics()
+            get_available_metrics_cached.clear()
+            get_persona_metric_counts.clear()
+            get_metric_source_flags.clear()
         st.sidebar.success("Data refreshed!")
 
 col3, col4 = st.sidebar.columns(2)        
@@ -320,7 +396,7 @@ st.sidebar.markdown("### 🔧 System Status")
 
 # Show metrics availability
 if METRICS_AVAILABLE:
-    available_count = sum(len(metric_registry.get_available_metrics(p)) for p in ['cfo', 'cio', 'cto'])
+    available_count = sum(get_persona_metric_counts().values())
     st.sidebar.markdown(f"<span class='status-good'>✅ **{available_count} Metrics Active**</span>", 
                        unsafe_allow_html=True)
     
@@ -332,19 +408,25 @@ else:
                        unsafe_allow_html=True)
 
 # HBCU Quick Stats (if available)
-if HBCU_INTEGRATION_AVAILABLE and hbcu_integrator:
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### 🏛️ HBCU Context")
+@st.fragment
+def render_hbcu_quick_stats():
+    """HBCU sidebar stats - rendered as a fragment so it reruns independently of the main panel"""
+    st.markdown("---")
+    st.markdown("### 🏛️ HBCU Context")
     
-    st.sidebar.metric("Students Served", "5,800", "↑ 3.2%")
-    st.sidebar.metric("Cost per Student", "$8,224", "40% below avg") 
-    st.sidebar.metric("Mission Alignment", "94%", "Excellent")
+    st.metric("Students Served", "5,800", "↑ 3.2%")
+    st.metric("Cost per Student", "$8,224", "40% below avg") 
+    st.metric("Mission Alignment", "94%", "Excellent")
+
+if HBCU_INTEGRATION_AVAILABLE and hbcu_integrator:
+    with st.sidebar:
+        render_hbcu_quick_stats()
 
 # ============================================================================
 # MAIN HEADER - Enhanced
 # ============================================================================
 
-st.markdown(ISSATheme.create_header("ISSA", "Integrated Systems for Strategic Analytics"), unsafe_allow_html=True)
+st.html(ISSATheme.create_header("ISSA", "Integrated Systems for Strategic Analytics"))
 st.markdown("### Deployed for Paul Quinn College")
 
 
@@ -352,7 +434,9 @@ st.markdown("### Deployed for Paul Quinn College")
 # ENHANCED CFO DASHBOARD SECTION - Complete Implementation
 # ============================================================================
 
-if persona == "CFO - Financial Steward":
+@st.fragment
+def render_cfo_dashboard():
+    """CFO persona panel - rendered as a fragment so in-panel widgets only rerun this view"""
     st.markdown("### 💰 CFO Dashboard - Financial Overview & Strategic Optimization")
     
     # Enhanced Executive Summary Row
@@ -435,20 +519,11 @@ if persona == "CFO - Financial Steward":
     )
     
     # Enhanced Tab Configuration
-    if METRICS_AVAILABLE and persona_key in ['cfo']:
-        tab_config = [
-            ("📊 Budget Analysis", ["cfo_budget_vs_actual", "cfo_total_it_spend_breakdown"]),
-            ("📃 Contract Intelligence", ["cfo_contract_expiration_alerts", "cfo_vendor_spend_optimization"]),
-            ("🤖 AI Optimization", []),  # NEW AI TAB
-            ("🏛️ Grant & Compliance", ["cfo_grant_compliance"]),
-            ("📈 ROI & Benchmarking", ["cfo_student_success_roi", "cfo_hbcu_peer_benchmarking"]),
-            ("📋 Executive Summary", [])
-        ]
-        
-        tab_names = [config[0] for config in tab_config]
-        tabs = st.tabs(tab_names)
+    if METRICS_AVAILABLE and persona_key in REGISTRY_PERSONAS:
+        tab_config = TAB_CONFIG_CFO
+        tabs = st.tabs(TAB_NAMES_CFO)
         
-        available_metrics = metric_registry.get_available_metrics('cfo')
+        available_metrics = get_available_metrics_cached('cfo')
         
         for idx, (tab, (tab_name, metrics_list)) in enumerate(zip(tabs, tab_config)):
             with tab:
@@ -471,11 +546,11 @@ if persona == "CFO - Financial Steward":
                         if st.button("📧 Email Stakeholders"):
                             st.success("Budget summary sent!")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Budget variance analysis with enhancements
                     if "cfo_budget_vs_actual" in available_metrics:
-                        dashboard_loader.display_cfo_budget_variance(st.container())
+                        dashboard_loader.display_cfo_budget_variance(tab)
                     else:
                         # Fallback enhanced visualization
                         st.info("📊 **Enhanced Budget Visualization Loading...**")
@@ -483,9 +558,9 @@ if persona == "CFO - Financial Steward":
                     
                     # Total IT spend breakdown
                     if "cfo_total_it_spend_breakdown" in available_metrics:
-                        st.markdown("---")
+                        st.divider()
                         st.markdown("### 📊 IT Spend Breakdown & Trends")
-                        dashboard_loader.display_generic_metric('cfo', 'cfo_total_it_spend_breakdown', st.container())
+                        dashboard_loader.display_generic_metric('cfo', 'cfo_total_it_spend_breakdown', tab)
                 
                 elif tab_name == "📃 Contract Intelligence":
                     st.markdown("### 📋 Smart Contract Management")
@@ -529,18 +604,18 @@ if persona == "CFO - Financial Steward":
                             unsafe_allow_html=True
                         )
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Contract expiration alerts
                     if "cfo_contract_expiration_alerts" in available_metrics:
-                        dashboard_loader.display_cfo_contract_alerts(st.container())
+                        dashboard_loader.display_cfo_contract_alerts(tab)
                     else:
                         st.info("Contract expiration metrics not available")
                     
                     # Vendor spend optimization
                     if "cfo_vendor_spend_optimization" in available_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cfo', 'cfo_vendor_spend_optimization', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cfo', 'cfo_vendor_spend_optimization', tab)
                 
                 elif tab_name == "🤖 AI Optimization":
                     st.markdown("### 🤖 AI-Powered Financial Optimization")
@@ -605,7 +680,7 @@ if persona == "CFO - Financial Steward":
                         st.markdown("**Optimization Impact Projection:**")
                         st.progress(0.89, text="89% confidence in $340K total savings")
                         
-                        st.markdown("---")
+                        st.divider()
                         
                         st.markdown("**🎯 Strategic Recommendations:**")
                         st.markdown("• **Rebalance Portfolio:** Move 15% from hardware to cloud")
@@ -614,7 +689,7 @@ if persona == "CFO - Financial Steward":
                         st.markdown("• **Grant Opportunity:** Apply for $200K digital equity grant")
                     
                     # Implementation Tracking
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### 📈 Optimization Tracking")
                     
                     tracking_data = pd.DataFrame({
@@ -636,7 +711,7 @@ if persona == "CFO - Financial Steward":
                     st.markdown("### 🏛️ Grant Management & Compliance Dashboard")
                     
                     if "cfo_grant_compliance" in available_metrics:
-                        dashboard_loader.display_cfo_grant_compliance(st.container())
+                        dashboard_loader.display_cfo_grant_compliance(tab)
                     else:
                         st.info("Grant compliance metrics not available")
                 
@@ -646,7 +721,7 @@ if persona == "CFO - Financial Steward":
                     col1, col2 = st.columns(2)
                     with col1:
                         if "cfo_student_success_roi" in available_metrics:
-                            dashboard_loader.display_generic_metric('cfo', 'cfo_student_success_roi', st.container())
+                            dashboard_loader.display_generic_metric('cfo', 'cfo_student_success_roi', col1)
                         else:
                             st.markdown("#### 🎓 Student Success ROI")
                             st.metric("Technology Impact on Retention", "12%", "↑ 3%")
@@ -655,7 +730,7 @@ if persona == "CFO - Financial Steward":
                             
                     with col2:
                         if "cfo_hbcu_peer_benchmarking" in available_metrics:
-                            dashboard_loader.display_generic_metric('cfo', 'cfo_hbcu_peer_benchmarking', st.container())
+                            dashboard_loader.display_generic_metric('cfo', 'cfo_hbcu_peer_benchmarking', col2)
                         else:
                             st.markdown("#### 🏫 HBCU Peer Comparison")
                             st.metric("IT Spend per Student", "$8,224", "15% below peer avg")
@@ -686,7 +761,7 @@ if persona == "CFO - Financial Steward":
                         st.metric("Compliance Rate", "96%", "↑ 2%")
                         st.metric("Process Efficiency", "91%", "↑ 8%")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Action Items
                     st.markdown("#### ⚡ Priority Action Items")
@@ -714,7 +789,9 @@ if persona == "CFO - Financial Steward":
         st.markdown("---")
         hbcu_integrator.render_hbcu_dashboard_section('cfo')
                 
-elif persona == "CIO - Strategic Partner":
+@st.fragment
+def render_cio_dashboard():
+    """CIO persona panel - rendered as a fragment so in-panel widgets only rerun this view"""
     st.markdown("### 🎯 CIO Dashboard - Strategic IT Portfolio Management")
     
     # Enhanced Executive Summary Row
@@ -775,19 +852,10 @@ elif persona == "CIO - Strategic Partner":
     
     # Enhanced Tab Configuration for CIO
     if METRICS_AVAILABLE:
-        tab_config = [
-            ("🎯 Strategic Portfolio", ["digital_transformation_metrics", "strategic_alignment_metrics"]),
-            ("💼 Business Analysis", ["business_unit_it_spend", "app_cost_analysis_metrics"]),
-            ("🤖 AI Strategy", []),  # NEW AI STRATEGY TAB
-            ("⚠️ Risk & Vendor Management", ["risk_metrics", "vendor_metrics"]),
-            ("📈 Performance Dashboard", ["project_performance", "innovation_metrics"]),
-            ("📋 Executive Brief", [])
-        ]
+        tab_config = TAB_CONFIG_CIO
+        tabs = st.tabs(TAB_NAMES_CIO)
         
-        tab_names = [config[0] for config in tab_config]
-        tabs = st.tabs(tab_names)
-        
-        available_cio_metrics = metric_registry.get_available_metrics('cio') if hasattr(metric_registry, 'get_available_metrics') else []
+        available_cio_metrics = get_available_metrics_cached('cio')
         
         for idx, (tab, (tab_name, metrics_list)) in enumerate(zip(tabs, tab_config)):
             with tab:
@@ -809,7 +877,7 @@ elif persona == "CIO - Strategic Partner":
                         if st.button("📧 Stakeholder Brief", key="cio_brief"):
                             st.success("Executive brief sent!")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Digital transformation progress
                     col1, col2 = st.columns(2)
@@ -847,8 +915,8 @@ elif persona == "CIO - Strategic Partner":
                     
                     # Load actual metrics if available
                     if "digital_transformation_metrics" in available_cio_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cio', 'digital_transformation_metrics', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cio', 'digital_transformation_metrics', tab)
                 
                 elif tab_name == "💼 Business Analysis":
                     st.markdown("### 💼 Business Unit IT Investment Analysis")
@@ -898,20 +966,20 @@ elif persona == "CIO - Strategic Partner":
                             unsafe_allow_html=True
                         )
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Application portfolio analysis
                     st.markdown("#### 📱 Application Portfolio Health")
                     
                     # Load actual metrics if available
                     if "business_unit_it_spend" in available_cio_metrics:
-                        dashboard_loader.display_generic_metric('cio', 'business_unit_it_spend', st.container())
+                        dashboard_loader.display_generic_metric('cio', 'business_unit_it_spend', tab)
                     else:
                         st.info("Business unit spend analysis loading...")
                     
                     if "app_cost_analysis_metrics" in available_cio_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cio', 'app_cost_analysis_metrics', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cio', 'app_cost_analysis_metrics', tab)
                 
                 elif tab_name == "🤖 AI Strategy":
                     st.markdown("### 🤖 AI-Powered Strategic Intelligence")
@@ -976,7 +1044,7 @@ elif persona == "CIO - Strategic Partner":
                         st.markdown("**Business Value Realization:**")
                         st.progress(0.92, text="92% confidence in projected outcomes")
                         
-                        st.markdown("---")
+                        st.divider()
                         
                         st.markdown("**🎯 Strategic Focus Areas:**")
                         st.markdown("• **Student Success Technology:** AI-powered retention tools")
@@ -985,7 +1053,7 @@ elif persona == "CIO - Strategic Partner":
                         st.markdown("• **Data-Driven Decisions:** Analytics infrastructure expansion")
                     
                     # Strategic Portfolio Tracking
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### 📈 Strategic Initiative Tracking")
                     
                     portfolio_data = pd.DataFrame({
@@ -1048,8 +1116,8 @@ elif persona == "CIO - Strategic Partner":
                     
                     # Load actual risk metrics
                     if "risk_metrics" in available_cio_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cio', 'risk_metrics', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cio', 'risk_metrics', tab)
                 
                 elif tab_name == "📈 Performance Dashboard":
                     st.markdown("### 📈 Strategic Performance & Innovation Metrics")
@@ -1099,7 +1167,7 @@ elif persona == "CIO - Strategic Partner":
                         st.metric("Vendor Performance", "8.2/10", "Strong")
                         st.metric("Strategic Opportunities", "3", "High impact")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Strategic action items
                     st.markdown("#### ⚡ Strategic Action Items")
@@ -1153,7 +1221,9 @@ elif persona == "CIO - Strategic Partner":
         st.markdown("---")
         hbcu_integrator.render_hbcu_dashboard_section('cio')
 
-elif persona == "CTO - Technology Operator":
+@st.fragment
+def render_cto_dashboard():
+    """CTO persona panel - rendered as a fragment so in-panel widgets only rerun this view"""
     st.markdown("### ⚙️ CTO Dashboard - Technical Operations & Infrastructure Excellence")
     
     # Enhanced Executive Summary Row
@@ -1214,19 +1284,10 @@ elif persona == "CTO - Technology Operator":
     
     # Enhanced Tab Configuration for CTO
     if METRICS_AVAILABLE:
-        tab_config = [
-            ("🖥️ Infrastructure & Performance", ["infrastructure_performance_metrics", "system_utilization_metrics"]),
-            ("☁️ Cloud & Asset Management", ["cloud_cost_optimization_metrics", "asset_lifecycle_management_metrics"]),
-            ("🤖 AI Operations", []),  # NEW AI OPERATIONS TAB
-            ("🔒 Security & Compliance", ["security_metrics_and_response", "compliance_monitoring"]),
-            ("⚡ Automation & Efficiency", ["automation_metrics", "technical_debt_metrics"]),
-            ("📋 Operations Summary", [])
-        ]
-        
-        tab_names = [config[0] for config in tab_config]
-        tabs = st.tabs(tab_names)
+        tab_config = TAB_CONFIG_CTO
+        tabs = st.tabs(TAB_NAMES_CTO)
         
-        available_cto_metrics = metric_registry.get_available_metrics('cto') if hasattr(metric_registry, 'get_available_metrics') else []
+        available_cto_metrics = get_available_metrics_cached('cto')
         
         for idx, (tab, (tab_name, metrics_list)) in enumerate(zip(tabs, tab_config)):
             with tab:
@@ -1248,7 +1309,7 @@ elif persona == "CTO - Technology Operator":
                         if st.button("📈 Capacity Report", key="cto_capacity"):
                             st.success("Capacity analysis generated!")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Infrastructure status overview
                     col1, col2 = st.columns(2)
@@ -1287,8 +1348,8 @@ elif persona == "CTO - Technology Operator":
                     
                     # Load actual metrics if available
                     if "infrastructure_performance_metrics" in available_cto_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cto', 'infrastructure_performance_metrics', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cto', 'infrastructure_performance_metrics', tab)
                 
                 elif tab_name == "☁️ Cloud & Asset Management":
                     st.markdown("### ☁️ Cloud Optimization & Asset Lifecycle Management")
@@ -1338,20 +1399,20 @@ elif persona == "CTO - Technology Operator":
                             unsafe_allow_html=True
                         )
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Asset management tracking
                     st.markdown("#### 📊 Asset Portfolio Overview")
                     
                     # Load actual cloud metrics
                     if "cloud_cost_optimization_metrics" in available_cto_metrics:
-                        dashboard_loader.display_generic_metric('cto', 'cloud_cost_optimization_metrics', st.container())
+                        dashboard_loader.display_generic_metric('cto', 'cloud_cost_optimization_metrics', tab)
                     else:
                         st.info("Cloud optimization metrics loading...")
                     
                     if "asset_lifecycle_management_metrics" in available_cto_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cto', 'asset_lifecycle_management_metrics', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cto', 'asset_lifecycle_management_metrics', tab)
                 
                 elif tab_name == "🤖 AI Operations":
                     st.markdown("### 🤖 AI-Powered Operations Intelligence")
@@ -1417,7 +1478,7 @@ elif persona == "CTO - Technology Operator":
                         st.markdown("**Security Threat Assessment:**")
                         st.progress(0.08, text="8% elevated threat level - normal range")
                         
-                        st.markdown("---")
+                        st.divider()
                         
                         st.markdown("**🎯 Automated Operations Status:**")
                         st.markdown("• **Backup Automation:** 100% scheduled tasks successful")
@@ -1426,7 +1487,7 @@ elif persona == "CTO - Technology Operator":
                         st.markdown("• **Incident Response:** 2.4 hour average resolution")
                     
                     # Operations Automation Tracking
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### 📈 Automation Implementation Status")
                     
                     automation_data = pd.DataFrame({
@@ -1476,8 +1537,8 @@ elif persona == "CTO - Technology Operator":
                     
                     # Load security metrics if available
                     if "security_metrics_and_response" in available_cto_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('cto', 'security_metrics_and_response', st.container())
+                        st.divider()
+                        dashboard_loader.display_generic_metric('cto', 'security_metrics_and_response', tab)
                 
                 elif tab_name == "⚡ Automation & Efficiency":
                     st.markdown("### ⚡ Automation Status & Technical Debt Management")
@@ -1504,7 +1565,7 @@ elif persona == "CTO - Technology Operator":
                         st.metric("Resource Optimization", "78%", "Utilization")
                     
                     # Technical debt breakdown
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### 📊 Technical Debt Analysis")
                     
                     debt_data = pd.DataFrame({
@@ -1546,7 +1607,7 @@ elif persona == "CTO - Technology Operator":
                         st.metric("Compliance Rate", "94%", "Excellent")
                         st.metric("Incident Count", "2", "Low impact")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Operations action items
                     st.markdown("#### ⚡ Critical Operations Items")
@@ -1601,7 +1662,9 @@ elif persona == "CTO - Technology Operator":
         hbcu_integrator.render_hbcu_dashboard_section('cto')
 
 
-elif persona == "Project Manager View":
+@st.fragment
+def render_pm_dashboard():
+    """Project Manager persona panel - rendered as a fragment so in-panel widgets only rerun this view"""
     st.markdown("### 📋 Project Management Dashboard - Portfolio & Delivery Excellence")
     
     # Enhanced Executive Summary Row
@@ -1662,19 +1725,8 @@ elif persona == "Project Manager View":
 
     # Enhanced PM Tab Configuration
     if PM_METRICS_AVAILABLE:
-        tab_config = [
-            ("📊 Portfolio Dashboard", ["project_portfolio_dashboard_metrics", "project_charter_metrics"]),
-            ("⏰ Timeline & Budget", ["project_timeline_budget_performance"]),
-            ("📋 Requirements & RAID", ["requirements_traceability_matrix", "raid_log_metrics"]),
-            ("🤖 AI Project Intelligence", []),  # NEW AI TAB
-            ("👥 Resources & Communication", ["resource_allocation_metrics", "stakeholder_communication_metrics"]),
-            ("📈 Executive Summary", [])
-        ]
-        
-        tab_names = [config[0] for config in tab_config]
-        tabs = st.tabs(tab_names)
-        
-        available_pm_metrics = list(PM_METRICS.keys()) if PM_METRICS_AVAILABLE else []
+        tab_config = TAB_CONFIG_PM
+        tabs = st.tabs(TAB_NAMES_PM)
         
         for idx, (tab, (tab_name, metrics_list)) in enumerate(zip(tabs, tab_config)):
             with tab:
@@ -1696,7 +1748,7 @@ elif persona == "Project Manager View":
                         if st.button("📧 Status Update", key="pm_status"):
                             st.success("Stakeholder update sent!")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Project status overview
                     col1, col2 = st.columns(2)
@@ -1734,9 +1786,9 @@ elif persona == "Project Manager View":
                             st.metric(metric, value, description)
                     
                     # Load actual PM metrics if available
-                    if "project_portfolio_dashboard_metrics" in available_pm_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('pm', 'project_portfolio_dashboard_metrics', st.container())
+                    if "project_portfolio_dashboard_metrics" in PM_METRIC_SET:
+                        st.divider()
+                        dashboard_loader.display_generic_metric('pm', 'project_portfolio_dashboard_metrics', tab)
                 
                 elif tab_name == "⏰ Timeline & Budget":
                     st.markdown("### ⏰ Project Timeline & Budget Performance")
@@ -1786,11 +1838,11 @@ elif persona == "Project Manager View":
                             unsafe_allow_html=True
                         )
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Timeline performance tracking
-                    if "project_timeline_budget_performance" in available_pm_metrics:
-                        dashboard_loader.display_generic_metric('pm', 'project_timeline_budget_performance', st.container())
+                    if "project_timeline_budget_performance" in PM_METRIC_SET:
+                        dashboard_loader.display_generic_metric('pm', 'project_timeline_budget_performance', tab)
                     else:
                         st.info("Timeline and budget performance metrics loading...")
                 
@@ -1827,13 +1879,13 @@ elif persona == "Project Manager View":
                             st.metric(metric, value, status)
                     
                     # Load RAID and requirements metrics
-                    if "raid_log_metrics" in available_pm_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('pm', 'raid_log_metrics', st.container())
+                    if "raid_log_metrics" in PM_METRIC_SET:
+                        st.divider()
+                        dashboard_loader.display_generic_metric('pm', 'raid_log_metrics', tab)
                     
-                    if "requirements_traceability_matrix" in available_pm_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('pm', 'requirements_traceability_matrix', st.container())
+                    if "requirements_traceability_matrix" in PM_METRIC_SET:
+                        st.divider()
+                        dashboard_loader.display_generic_metric('pm', 'requirements_traceability_matrix', tab)
                 
                 elif tab_name == "🤖 AI Project Intelligence":
                     st.markdown("### 🤖 AI-Powered Project Intelligence")
@@ -1898,7 +1950,7 @@ elif persona == "Project Manager View":
                         st.markdown("**Risk Probability Assessment:**")
                         st.progress(0.24, text="24% chance of scope creep - moderate risk")
                         
-                        st.markdown("---")
+                        st.divider()
                         
                         st.markdown("**🎯 AI Project Insights:**")
                         st.markdown("• **Critical Path:** Student Portal has 2-day buffer")
@@ -1907,7 +1959,7 @@ elif persona == "Project Manager View":
                         st.markdown("• **Stakeholder Health:** 4.2/5 satisfaction maintained")
                     
                     # Project Health Tracking
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### 📈 AI-Enhanced Project Tracking")
                     
                     project_health_data = pd.DataFrame({
@@ -1945,13 +1997,13 @@ elif persona == "Project Manager View":
                         st.metric("Client Satisfaction", "4.4/5", "Excellent")
                     
                     # Load resource and communication metrics
-                    if "resource_allocation_metrics" in available_pm_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('pm', 'resource_allocation_metrics', st.container())
+                    if "resource_allocation_metrics" in PM_METRIC_SET:
+                        st.divider()
+                        dashboard_loader.display_generic_metric('pm', 'resource_allocation_metrics', tab)
                     
-                    if "stakeholder_communication_metrics" in available_pm_metrics:
-                        st.markdown("---")
-                        dashboard_loader.display_generic_metric('pm', 'stakeholder_communication_metrics', st.container())
+                    if "stakeholder_communication_metrics" in PM_METRIC_SET:
+                        st.divider()
+                        dashboard_loader.display_generic_metric('pm', 'stakeholder_communication_metrics', tab)
                 
                 elif tab_name == "📈 Executive Summary":
                     st.markdown("### 📈 Project Management Executive Summary")
@@ -1977,7 +2029,7 @@ elif persona == "Project Manager View":
                         st.metric("ROI Achievement", "3.4x", "Above target")
                         st.metric("Stakeholder NPS", "+45", "Excellent")
                     
-                    st.markdown("---")
+                    st.divider()
                     
                     # Project management action items
                     st.markdown("#### ⚡ Critical PM Action Items")
@@ -2041,7 +2093,9 @@ elif persona == "Project Manager View":
         with col4:
             st.metric("Portfolio Health", "8.1/10", "+0.3 improved")
 
-elif persona == "HBCU Institutional View":
+@st.fragment
+def render_hbcu_dashboard():
+    """HBCU institutional persona panel - rendered as a fragment so in-panel widgets only rerun this view"""
     st.markdown("### 🎓 HBCU Institutional Performance Dashboard")
     st.markdown("*Paul Quinn College Mission-Aligned Analytics*")
     
@@ -2476,29 +2530,42 @@ elif persona == "HBCU Institutional View":
         with col4:
             st.metric("Peer Ranking", "2nd", "of 12 HBCUs")
 
+# Persona key -> dashboard panel
+PERSONA_RENDERERS = {
+    "cfo": render_cfo_dashboard,
+    "cio": render_cio_dashboard,
+    "cto": render_cto_dashboard,
+    "pm": render_pm_dashboard,
+    "hbcu": render_hbcu_dashboard
+}
+
+PERSONA_RENDERERS[persona_key]()
+
 # Footer with metrics summary
 st.markdown("---")
 
 # Display overall metrics availability
-if METRICS_AVAILABLE:
+@st.fragment
+def render_system_metrics_overview():
+    """Footer metrics summary - rendered as a fragment so it reruns independently of the main panel"""
     with st.expander("📊 System Metrics Overview"):
         col1, col2, col3, col4 = st.columns(4)
+        counts = get_persona_metric_counts()
         
         with col1:
-            cfo_count = len(metric_registry.get_available_metrics('cfo'))
-            st.metric("CFO Metrics", cfo_count)
+            st.metric("CFO Metrics", counts['cfo'])
         
         with col2:
-            cio_count = len(metric_registry.get_available_metrics('cio'))
-            st.metric("CIO Metrics", cio_count)
+            st.metric("CIO Metrics", counts['cio'])
         
         with col3:
-            cto_count = len(metric_registry.get_available_metrics('cto'))
-            st.metric("CTO Metrics", cto_count)
+            st.metric("CTO Metrics", counts['cto'])
         
         with col4:
-            total_count = cfo_count + cio_count + cto_count
-            st.metric("Total Metrics", total_count)
+            st.metric("Total Metrics", sum(counts.values()))
+
+if METRICS_AVAILABLE:
+    render_system_metrics_overview()
 
 st.markdown(
     """
@@ -2511,22 +2578,27 @@ st.markdown(
 )
 
 # Debug information (can be removed in production)
-if st.checkbox("🔧 Show Debug Info", value=False):
+@st.fragment
+def render_debug_panel():
+    """Debug info - rendered as a fragment so toggling it does not rerun the dashboard"""
+    if not st.checkbox("🔧 Show Debug Info", value=False):
+        return
+    
     st.markdown("### Debug Information")
     
     if METRICS_AVAILABLE:
         st.write("Metric Registry Status: ✅ Active")
         
         # Show loaded metrics
-        for persona in ['cfo', 'cio', 'cto']:
-            with st.expander(f"{persona.upper()} Metrics"):
-                metrics = metric_registry.get_available_metrics(persona)
-                for metric in metrics:
-                    info = metric_registry.get_metric_info(persona, metric)
+        for debug_persona in ['cfo', 'cio', 'cto']:
+            with st.expander(f"{debug_persona.upper()} Metrics"):
+                for metric, has_data, has_module, has_script in get_metric_source_flags(debug_persona):
                     st.write(f"- {metric}: ", 
-                           "📄" if info['data_path'] else "❌",
-                           "🔧" if info['module_path'] else "❌",
-                           "📜" if info['script_path'] else "❌")
+                           "📄" if has_data else "❌",
+                           "🔧" if has_module else "❌",
+                           "📜" if has_script else "❌")
     else:
         st.write("Metric Registry Status: ❌ Not Available")
-        st.write("Check that metric_registry.py and dashboard_metric_loader.py are in the same directory")
\ No newline at end of file
+        st.write("Check that metric_registry.py and dashboard_metric_loader.py are in the same directory")
+
+render_debug_panel()
@@ -4,36 +4,464 @@ HBCU Metrics Integration Module for Paul Quinn College IT Analytics Suite
 Enhanced with actual data visualizations from CSV files
 """
 
+import re
+import numpy as np
 import pandas as pd
 import streamlit as st
-from typing import Dict, List, Any
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+# Plotly is imported inside the figure builders so loading this module (and
+# serving cached figures) does not pay for Plotly's import graph up front
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Value extraction patterns for the free-text Example column
+_DOLLAR_RE = re.compile(r'\$([0-9,]+)')
+_BENCHMARK_RE = re.compile(r'(\w+): \$([0-9,]+)')
+_PCT_RE = re.compile(r'(\d+)%')
+_NUMBER_RE = re.compile(r'(\d+)')
+
+# Optional pyarrow backend - faster CSV parsing and Arrow-backed string columns
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+_CSV_ENGINE = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+_STRING_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+
+# Columns the HBCU views actually use - anything else in the files is skipped at read time
+HBCU_COLUMNS = ['Metric', 'Description', 'Example']
+HBCU_COLUMN_DTYPES = {'Metric': 'category', 'Description': _STRING_DTYPE, 'Example': _STRING_DTYPE}
+
+# Column layout for the HBCU detail tables (the grid handles the formatting, no Styler needed)
+HBCU_TABLE_COLUMN_CONFIG = {
+    'Metric': st.column_config.TextColumn('Metric', width='medium'),
+    'Description': st.column_config.TextColumn('Description', width='large'),
+    'Example': st.column_config.TextColumn('Example', width='large')
+}
+
+# Upper bound on points per chart trace - larger series are M4-reduced before plotting
+MAX_CHART_POINTS = 2000
+
+# Directory holding the HBCU metric files
+HBCU_METRICS_DIR = Path(__file__).resolve().parent.parent / 'metrics' / 'hbcu'
+
+# HBCU metric category -> source file name (without extension)
+HBCU_METRIC_FILES = {
+    'cost_efficiency': 'hbcu_cost_per_student_served_examples',
+    'grant_compliance': 'hbcu_grant_compliance_tracking_examples',
+    'resource_maximization': 'hbcu_resource_maximization_examples',
+    'student_success_roi': 'hbcu_student_success_roi_examples'
+}
+
+# HBCU metric category -> metric card icon
+CATEGORY_ICONS = {
+    'cost_efficiency': '💵',
+    'grant_compliance': '🏛️',
+    'resource_maximization': '📈',
+    'student_success_roi': '🎓'
+}
+
+
+def _hbcu_table_paths(base_path: Path, file_stem: str):
+    """CSV and Parquet locations for one HBCU table"""
+    return base_path / f"{file_stem}.csv", base_path / f"{file_stem}.parquet"
+
+def _hbcu_table_exists(base_path: Path, file_stem: str) -> bool:
+    """Whether a readable copy of the table is on disk"""
+    csv_path, parquet_path = _hbcu_table_paths(base_path, file_stem)
+    return csv_path.exists() or (PYARROW_AVAILABLE and parquet_path.exists())
+
+def _read_hbcu_table(base_path: Path, file_stem: str) -> Optional[pd.DataFrame]:
+    """Read one HBCU table, preferring an up-to-date Parquet copy over the CSV.
+    Returns None when the file lacks one of HBCU_COLUMNS."""
+    csv_path, parquet_path = _hbcu_table_paths(base_path, file_stem)
+    
+    if PYARROW_AVAILABLE and parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        import pyarrow.parquet as pq
+        if not set(HBCU_COLUMNS).issubset(pq.read_schema(parquet_path).names):
+            return None
+        return pd.read_parquet(parquet_path, engine='pyarrow', columns=HBCU_COLUMNS)
+    
+    # Check the header up front so a malformed file is skipped rather than half-loaded
+    if not set(HBCU_COLUMNS).issubset(pd.read_csv(csv_path, nrows=0).columns):
+        return None
+    return pd.read_csv(csv_path, usecols=HBCU_COLUMNS, dtype=HBCU_COLUMN_DTYPES, engine=_CSV_ENGINE)
+
+
+def _prepare_hbcu_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink column dtypes and index the table by metric name"""
+    # Metric/Category are short repeated labels - categoricals compare on integer codes
+    # (Description is unique free text and keeps its string dtype)
+    for column in ('Metric', 'Category'):
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    
+    # Numeric columns (the Example column is free text and stays as-is)
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    for column in df.select_dtypes(include='float').columns:
+        df[column] = pd.to_numeric(df[column], downcast='float')
+    
+    # Index by metric name (keeping the column) so single-metric lookups are hash-based
+    return df.set_index('Metric', drop=False).rename_axis(None)
+
+
+def convert_hbcu_csvs_to_parquet(base_path: Path = None):
+    """One-time build step: write a Parquet copy next to each HBCU CSV (requires pyarrow).
+    Run it with: python src/dashboard/hbcu_metrics_integration.py"""
+    base_path = Path(base_path) if base_path is not None else HBCU_METRICS_DIR
+    for file_stem in HBCU_METRIC_FILES.values():
+        csv_path, parquet_path = _hbcu_table_paths(base_path, file_stem)
+        if csv_path.exists():
+            pd.read_csv(csv_path).to_parquet(parquet_path, engine='pyarrow', index=False)
+
+
+def _hbcu_files_signature(base_path: Path) -> tuple:
+    """Modification times (ns, None when absent) of every HBCU CSV/Parquet file - changes whenever one is edited"""
+    signature = []
+    for file_stem in HBCU_METRIC_FILES.values():
+        for path in _hbcu_table_paths(base_path, file_stem):
+            try:
+                signature.append(path.stat().st_mtime_ns)
+            except OSError:
+                signature.append(None)
+    return tuple(signature)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _load_hbcu_metrics_cached(base_path: Path, files_signature: tuple) -> Dict[str, pd.DataFrame]:
+    """Parse the HBCU metric files once and share the DataFrames across reruns and sessions.
+    files_signature (see _hbcu_files_signature) is part of the cache key, so editing a file
+    triggers a re-read on the next rerun. Missing files, and files without the expected
+    columns, are skipped."""
+    present = {
+        category: file_stem for category, file_stem in HBCU_METRIC_FILES.items()
+        if _hbcu_table_exists(base_path, file_stem)
+    }
+    if not present:
+        return {}
+    
+    # The files are independent and the parsers release the GIL, so read them concurrently
+    with ThreadPoolExecutor(max_workers=len(present)) as executor:
+        futures = {
+            category: executor.submit(_read_hbcu_table, base_path, file_stem)
+            for category, file_stem in present.items()
+        }
+        tables = {category: future.result() for category, future in futures.items()}
+    return {category: _prepare_hbcu_table(df) for category, df in tables.items() if df is not None}
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(category: str, df: pd.DataFrame) -> bytes:
+    """CSV export for a category's download button, serialized once rather than on every rerun"""
+    return df.to_csv(index=False).encode('utf-8')
+
+def _m4_indices(values: np.ndarray, n_out: int = None) -> np.ndarray:
+    """Row positions kept by M4 reduction - first, min, max and last of each of n_out/4 buckets"""
+    n_out = n_out or MAX_CHART_POINTS
+    if len(values) <= n_out:
+        return np.arange(len(values))
+    keep = []
+    for bucket in np.array_split(np.arange(len(values)), n_out // 4):
+        bucket_values = values[bucket]
+        keep.extend((bucket[0], bucket[bucket_values.argmin()], bucket[bucket_values.argmax()], bucket[-1]))
+    return np.unique(keep)
+
+@lru_cache(maxsize=None)
+def _format_category_label(category: str) -> str:
+    """Display label for a category key, e.g. 'cost_efficiency' -> 'Cost Efficiency'"""
+    return category.replace('_', ' ').title()
+
+def _extract_first(examples: pd.Series, pattern: 're.Pattern') -> pd.Series:
+    """First capture of pattern in each Example value (NA where there is no match)"""
+    return examples.astype(str).str.extract(pattern, expand=False)
+
+def _truncate_labels(names: pd.Series, width: int, ellipsis: bool = False) -> pd.Series:
+    """Metric names cut to width characters for chart labels"""
+    names = names.astype(str)
+    if not ellipsis:
+        return names.str.slice(0, width)
+    return names.where(names.str.len() <= width, names.str.slice(0, width) + '...')
+
+# ============================================================================
+# Cached Plotly figure builders - the HBCU tables are static, so each figure
+# is built once per distinct DataFrame and reused across reruns
+# ============================================================================
+
+@st.cache_data(show_spinner=False)
+def _build_cost_efficiency_figure(df: pd.DataFrame) -> Optional['go.Figure']:
+    """Cost efficiency bars and the HBCU vs peer benchmark side by side in one figure"""
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+    # Extract the first dollar amount in each Example value for visualization
+    amounts = _extract_first(df['Example'], _DOLLAR_RE)
+    has_amount = amounts.notna()
+    cost_metrics = pd.DataFrame({
+        'Metric': _truncate_labels(df['Metric'][has_amount], 30, ellipsis=True).to_numpy(),
+        'Value': amounts[has_amount].str.replace(',', '', regex=False).astype(int).to_numpy()
+    })
+    cost_metrics = cost_metrics.iloc[_m4_indices(cost_metrics['Value'].to_numpy())]
+    
+    # Comparison data for benchmark metric
+    matches = []
+    if 'Benchmark Comparison Per Student Cost' in df.index:
+        matches = _BENCHMARK_RE.findall(df.at['Benchmark Comparison Per Student Cost', 'Example'])
+    
+    if cost_metrics.empty and not matches:
+        return None
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Cost Efficiency Metrics', 'Cost per Student Comparison')
+    )
+    
+    if not cost_metrics.empty:
+        cost_fig = px.bar(cost_metrics, x='Metric', y='Value',
+                          color='Value',
+                          color_continuous_scale='Blues')
+        fig.add_traces(list(cost_fig.data), rows=1, cols=1)
+        fig.update_layout(coloraxis=cost_fig.layout.coloraxis)
+        fig.update_xaxes(tickangle=-45, row=1, col=1)
+    
+    if matches:
+        comparison_data = pd.DataFrame([
+            {'Institution': match[0], 'Cost': int(match[1].replace(',', ''))}
+            for match in matches
+        ])
+        benchmark_fig = px.bar(comparison_data, x='Institution', y='Cost',
+                               color='Institution',
+                               color_discrete_map={'HBCU': '#2ca02c', 'Peer': '#ff7f0e'})
+        fig.add_traces(list(benchmark_fig.data), rows=1, cols=2)
+    
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_grant_compliance_figure(df: pd.DataFrame) -> Optional['go.Figure']:
+    """Compliance gauge and risk assessment bars side by side in one figure"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    # Plain substring masks - no regex compile per call
+    metric_names = df['Metric'].astype(str)
+    
+    # Gauge shows the mean of the percentages reported by the first compliance metric that has any
+    avg_compliance = None
+    compliance_examples = df['Example'][metric_names.str.contains('Compliance', regex=False)]
+    percentages = compliance_examples.astype(str).reset_index(drop=True).str.extractall(_PCT_RE)[0]
+    if not percentages.empty:
+        first_row = percentages.index.get_level_values(0)[0]
+        avg_compliance = float(percentages.xs(first_row, level=0).astype(np.int32).to_numpy().mean())
+    risk_mask = metric_names.str.contains('Risk', regex=False) | metric_names.str.contains('Audit', regex=False)
+    
+    risk_df = df[risk_mask]
+    risk_levels = _extract_first(risk_df['Example'], _NUMBER_RE)
+    has_level = risk_levels.notna()
+    risk_data = pd.DataFrame({
+        'Category': _truncate_labels(risk_df['Metric'][has_level], 20).to_numpy(),
+        'Risk Level': risk_levels[has_level].astype(int).to_numpy()
+    })
+    risk_data = risk_data.iloc[_m4_indices(risk_data['Risk Level'].to_numpy())]
+    
+    if avg_compliance is None and risk_data.empty:
+        return None
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('', 'Risk Assessment by Category'),
+        specs=[[{'type': 'indicator'}, {'type': 'xy'}]]
+    )
+    
+    if avg_compliance is not None:
+        fig.add_trace(
+            go.Indicator(
+                mode = "gauge+number+delta",
+                value = avg_compliance,
+                title = {'text': "Overall Compliance Rate"},
+                delta = {'reference': 90, 'increasing': {'color': "green"}},
+                gauge = {
+                    'axis': {'range': [None, 100]},
+                    'bar': {'color': "#2ca02c"},
+                    'steps': [
+                        {'range': [0, 70], 'color': "#ffebee"},
+                        {'range': [70, 90], 'color': "#fff3cd"},
+                        {'range': [90, 100], 'color': "#d4edda"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': 95
+                    }
+                }
+            ),
+            row=1, col=1
+        )
+    
+    if not risk_data.empty:
+        risk_fig = px.bar(risk_data, x='Category', y='Risk Level',
+                          color='Risk Level',
+                          color_continuous_scale=['green', 'yellow', 'red'])
+        fig.add_traces(list(risk_fig.data), rows=1, cols=2)
+        fig.update_layout(coloraxis=risk_fig.layout.coloraxis)
+        fig.update_xaxes(title_text='Category', row=1, col=2)
+        fig.update_yaxes(title_text='Risk Level', row=1, col=2)
+    
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_student_success_figure(df: pd.DataFrame) -> 'go.Figure':
+    """2x2 student success overview built from the percentage metrics"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    # Create subplot figure
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Success Rates', 'Technology Impact', 'Support Utilization', 'Performance Trends'),
+        specs=[[{'type': 'bar'}, {'type': 'scatter'}],
+               [{'type': 'bar'}, {'type': 'scatter'}]]
+    )
+    
+    # Extract percentage values from metrics
+    rates = _extract_first(df['Example'], _PCT_RE)
+    has_rate = rates.notna()
+    
+    if has_rate.any():
+        # Plain numpy arrays serialize on plotly's fast path (orjson when installed)
+        metric_labels = _truncate_labels(df['Metric'][has_rate], 20, ellipsis=True).to_numpy()
+        rate_values = rates[has_rate].astype(int).to_numpy()
+        keep = _m4_indices(rate_values)
+        metric_labels, rate_values = metric_labels[keep], rate_values[keep]
+        
+        fig.add_traces(
+            [
+                # Bar chart for success rates
+                go.Bar(x=metric_labels, y=rate_values, name='Success Rate',
+                       marker_color='lightblue'),
+                # Line chart for trends
+                go.Scattergl(x=metric_labels, y=rate_values, mode='lines+markers',
+                             name='Trend', line=dict(color='orange', width=2)),
+                # Horizontal bars for distribution (a pie degrades badly as slices grow)
+                go.Bar(x=rate_values, y=metric_labels, orientation='h', name='Distribution'),
+                # Scatter plot for correlation
+                go.Scattergl(x=np.arange(len(rate_values)), y=rate_values,
+                             mode='markers', marker=dict(size=12, color=rate_values,
+                             colorscale='Viridis', showscale=True),
+                             name='Performance')
+            ],
+            rows=[1, 1, 2, 2], cols=[1, 2, 1, 2]
+        )
+    
+    fig.update_layout(height=600, showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_resource_maximization_figure(df: pd.DataFrame) -> 'go.Figure':
+    """Allocation and comparison bars for the ratio/percentage metrics"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    # Create comprehensive resource analysis
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Resource Allocation', 'Efficiency Trends'),
+        specs=[[{'type': 'bar'}, {'type': 'bar'}]]
+    )
+    
+    # Extract ratio/percentage data
+    # Plain substring masks - no regex compile per call
+    ratio_mask = (df['Metric'].astype(str).str.contains('Ratio', regex=False)
+                  | df['Example'].astype(str).str.contains('%', regex=False))
+    
+    ratio_df = df[ratio_mask]
+    values = _extract_first(ratio_df['Example'], _NUMBER_RE)
+    has_value = values.notna()
+    
+    if has_value.any():
+        # Plain numpy arrays serialize on plotly's fast path (orjson when installed)
+        alloc_labels = _truncate_labels(ratio_df['Metric'][has_value], 25).to_numpy()
+        alloc_values = values[has_value].astype(int).to_numpy()
+        keep = _m4_indices(alloc_values)
+        alloc_labels, alloc_values = alloc_labels[keep], alloc_values[keep]
+        
+        fig.add_traces(
+            [
+                # Horizontal bars for allocation (a pie degrades badly as slices grow)
+                go.Bar(x=alloc_values, y=alloc_labels, orientation='h'),
+                # Bar chart for comparison
+                go.Bar(x=alloc_labels, y=alloc_values, marker_color='lightgreen')
+            ],
+            rows=[1, 1], cols=[1, 2]
+        )
+    
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+# HBCU metric category -> figure builder
+CATEGORY_FIGURE_BUILDERS = {
+    'cost_efficiency': _build_cost_efficiency_figure,
+    'grant_compliance': _build_grant_compliance_figure,
+    'resource_maximization': _build_resource_maximization_figure,
+    'student_success_roi': _build_student_success_figure
+}
 
 class HBCUMetricsIntegrator:
     """
     Integrates HBCU-specific institutional metrics with existing persona-based dashboards
     """
     
-    def __init__(self):
+    def __init__(self, files_signature: tuple = None):
+        self.files_signature = files_signature if files_signature is not None else _hbcu_files_signature(HBCU_METRICS_DIR)
         self.hbcu_metrics = self._load_hbcu_metrics()
         self.persona_mappings = self._define_persona_mappings()
+        self._persona_frames = self._build_persona_frames()
+        self._display_names = {
+            category: _format_category_label(category) for category in self.hbcu_metrics
+        }
+        self._csv_blobs = {
+            category: _df_to_csv_bytes(category, df) for category, df in self.hbcu_metrics.items()
+        }
+        self._chart_figures = {}
+        self._precompute_chart_data()
+    
+    def _precompute_chart_data(self):
+        """Parse the Example values and build every category figure once, since the tables are static"""
+        for persona, categories in self._persona_frames.items():
+            for category, df in categories.items():
+                self._get_category_figure(category, df, persona)
+        
+        for category, df in self.hbcu_metrics.items():
+            self._get_category_figure(category, df, 'institutional')
+    
+    def _get_category_figure(self, category: str, df: pd.DataFrame, persona: str) -> Optional['go.Figure']:
+        """Figure for a persona's view of a category, built on first use and reused afterwards"""
+        key = (persona, category)
+        if key not in self._chart_figures:
+            builder = CATEGORY_FIGURE_BUILDERS.get(category)
+            self._chart_figures[key] = builder(df) if builder else None
+        return self._chart_figures[key]
     
     def _load_hbcu_metrics(self) -> Dict[str, pd.DataFrame]:
         """Load all HBCU CSV files into organized DataFrames"""
-        import os
-        base_path = os.path.join(os.path.dirname(__file__), '..', 'metrics', 'hbcu')
-        try:
-            return {
-                'cost_efficiency': pd.read_csv(os.path.join(base_path, 'hbcu_cost_per_student_served_examples.csv')),
-                'grant_compliance': pd.read_csv(os.path.join(base_path, 'hbcu_grant_compliance_tracking_examples.csv')),
-                'resource_maximization': pd.read_csv(os.path.join(base_path, 'hbcu_resource_maximization_examples.csv')),
-                'student_success_roi': pd.read_csv(os.path.join(base_path, 'hbcu_student_success_roi_examples.csv'))
-            }
-        except FileNotFoundError as e:
-            st.warning(f"HBCU metrics file not found: {e}")
-            return {}
+        hbcu_metrics = _load_hbcu_metrics_cached(HBCU_METRICS_DIR, self.files_signature)
+        for category, file_stem in HBCU_METRIC_FILES.items():
+            if category in hbcu_metrics:
+                continue
+            if _hbcu_table_exists(HBCU_METRICS_DIR, file_stem):
+                st.warning(
+                    f"HBCU metrics file skipped - missing expected columns {HBCU_COLUMNS}: "
+                    f"{HBCU_METRICS_DIR / (file_stem + '.csv')}"
+                )
+            else:
+                st.warning(f"HBCU metrics file not found: {HBCU_METRICS_DIR / (file_stem + '.csv')}")
+        return hbcu_metrics
     
     def _define_persona_mappings(self) -> Dict[str, Dict[str, List[str]]]:
         """Define which HBCU metrics map to each persona"""
@@ -86,23 +514,29 @@ class HBCUMetricsIntegrator:
             }
         }
     
+    def _build_persona_frames(self) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """Pre-filter each category DataFrame for every persona once at startup"""
+        persona_frames = {}
+        for persona, categories in self.persona_mappings.items():
+            persona_metrics = {}
+            for category, metric_names in categories.items():
+                if category in self.hbcu_metrics:
+                    df = self.hbcu_metrics[category]
+                    filtered_df = df.loc[df.index.intersection(metric_names)]
+                    if not filtered_df.empty:
+                        persona_metrics[category] = filtered_df
+            persona_frames[persona] = persona_metrics
+        
+        return persona_frames
+    
     def get_persona_hbcu_metrics(self, persona: str) -> Dict[str, pd.DataFrame]:
         """Get HBCU metrics filtered for specific persona"""
-        if persona not in self.persona_mappings:
-            return {}
-        
-        persona_metrics = {}
-        for category, metric_names in self.persona_mappings[persona].items():
-            if category in self.hbcu_metrics:
-                df = self.hbcu_metrics[category]
-                filtered_df = df[df['Metric'].isin(metric_names)]
-                if not filtered_df.empty:
-                    persona_metrics[category] = filtered_df
-        
-        return persona_metrics
+        return self._persona_frames.get(persona, {})
     
+    @st.fragment
     def render_hbcu_dashboard_section(self, persona: str):
-        """Render HBCU metrics section for persona dashboard"""
+        """Render HBCU metrics section for persona dashboard (as a fragment, so interactions
+        inside it rerun only this section rather than the host dashboard)"""
         st.markdown("### 🎓 HBCU Institutional Metrics")
         
         hbcu_metrics = self.get_persona_hbcu_metrics(persona)
@@ -113,12 +547,12 @@ class HBCUMetricsIntegrator:
         
         # Create tabs for different HBCU metric categories
         if len(hbcu_metrics) > 1:
-            tabs = st.tabs([self._format_category_name(cat) for cat in hbcu_metrics.keys()])
+            tabs = st.tabs([self._display_names[cat] for cat in hbcu_metrics])
             for tab, (category, df) in zip(tabs, hbcu_metrics.items()):
                 with tab:
                     self._render_metric_category(category, df, persona)
         else:
-            category, df = list(hbcu_metrics.items())[0]
+            category, df = next(iter(hbcu_metrics.items()))
             self._render_metric_category(category, df, persona)
     
     def _render_metric_category(self, category: str, df: pd.DataFrame, persona: str):
@@ -127,51 +561,22 @@ class HBCUMetricsIntegrator:
         
         # Key metrics cards
         cols = st.columns(min(4, len(df)))
-        for idx, (_, row) in enumerate(df.head(4).iterrows()):
-            with cols[idx % 4]:
-                self._render_metric_card(row['Metric'], row['Example'], category)
+        for col, (metric_name, value) in zip(cols, df.head(4)[['Metric', 'Example']].itertuples(index=False, name=None)):
+            with col:
+                self._render_metric_card(metric_name, value, category)
         
         # Category-specific visualizations with real data
         self._render_category_visualization(category, df, persona)
         
         # Detailed metrics table
         with st.expander("📊 View Detailed Metrics"):
-            # Style the dataframe for better visibility
-            styled_df = df[['Metric', 'Description', 'Example']].style.set_properties(**{
-                'background-color': '#f8f9fa',
-                'border': '1px solid #dee2e6',
-                'padding': '8px'
-            })
-            st.dataframe(styled_df, use_container_width=True, hide_index=True)
+            # Plain frame with a fixed height keeps the grid virtualized (a Styler forces full rendering)
+            st.dataframe(df[HBCU_COLUMNS], use_container_width=True, hide_index=True, height=300,
+                         column_config=HBCU_TABLE_COLUMN_CONFIG)
     
     def _render_metric_card(self, metric_name: str, value: str, category: str):
-        """Render individual metric card with HBCU styling"""
-        # Color coding by category
-        colors = {
-            'cost_efficiency': '#1f77b4',
-            'grant_compliance': '#ff7f0e', 
-            'resource_maximization': '#2ca02c',
-            'student_success_roi': '#d62728'
-        }
-        
-        color = colors.get(category, '#333333')
-        
-        st.markdown(
-            f"""
-            <div style="
-                background: linear-gradient(135deg, {color}15, {color}05);
-                border-left: 4px solid {color};
-                padding: 1rem;
-                margin: 0.5rem 0;
-                border-radius: 0.5rem;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            ">
-                <h4 style="margin: 0; color: {color}; font-size: 0.9rem;">{metric_name}</h4>
-                <p style="margin: 0.5rem 0 0 0; font-size: 1.3rem; font-weight: bold;">{value}</p>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        """Render individual metric card as a native st.metric with a category icon"""
+        st.metric(label=f"{CATEGORY_ICONS.get(category, '📊')} {metric_name}", value=value)
     
     def _render_category_visualization(self, category: str, df: pd.DataFrame, persona: str):
         """Render visualizations using actual data from CSV files"""
@@ -189,225 +594,31 @@ class HBCUMetricsIntegrator:
         """Render comprehensive cost efficiency visualizations"""
         st.markdown("##### 📊 Cost Efficiency Analysis")
         
-        # Create two columns for charts
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Extract numeric values from Example column for visualization
-            cost_metrics = []
-            for _, row in df.iterrows():
-                import re
-                # Extract dollar amounts from the Example column
-                amounts = re.findall(r'\$([0-9,]+)', row['Example'])
-                if amounts:
-                    # Take the first amount found
-                    value = int(amounts[0].replace(',', ''))
-                    cost_metrics.append({
-                        'Metric': row['Metric'][:30] + '...' if len(row['Metric']) > 30 else row['Metric'],
-                        'Value': value
-                    })
-            
-            if cost_metrics:
-                cost_df = pd.DataFrame(cost_metrics)
-                fig = px.bar(cost_df, x='Metric', y='Value',
-                           title='Cost Efficiency Metrics',
-                           color='Value',
-                           color_continuous_scale='Blues')
-                fig.update_layout(
-                    xaxis_tickangle=-45,
-                    height=400,
-                    showlegend=False
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Comparison chart for benchmark data
-            benchmark_row = df[df['Metric'].str.contains('Benchmark', case=False)]
-            if not benchmark_row.empty:
-                import re
-                value = benchmark_row.iloc[0]['Example']
-                matches = re.findall(r'(\w+): \$([0-9,]+)', value)
-                
-                if matches:
-                    comparison_data = pd.DataFrame([
-                        {'Institution': match[0], 'Cost': int(match[1].replace(',', ''))}
-                        for match in matches
-                    ])
-                    
-                    fig = px.bar(comparison_data, x='Institution', y='Cost',
-                               title='Cost per Student Comparison',
-                               color='Institution',
-                               color_discrete_map={'HBCU': '#2ca02c', 'Peer': '#ff7f0e'})
-                    fig.update_layout(height=400, showlegend=False)
-                    st.plotly_chart(fig, use_container_width=True)
+        fig = self._get_category_figure('cost_efficiency', df, persona)
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True)
     
     def _render_student_success_charts(self, df: pd.DataFrame, persona: str):
         """Render student success ROI visualizations"""
         st.markdown("##### 🎓 Student Success Impact Analysis")
-        
-        # Create subplot figure
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Success Rates', 'Technology Impact', 'Support Utilization', 'Performance Trends'),
-            specs=[[{'type': 'bar'}, {'type': 'scatter'}],
-                   [{'type': 'pie'}, {'type': 'scatter'}]]
-        )
-        
-        # Extract percentage values from metrics
-        success_rates = []
-        for _, row in df.iterrows():
-            import re
-            percentages = re.findall(r'(\d+)%', row['Example'])
-            if percentages:
-                success_rates.append({
-                    'Metric': row['Metric'][:20] + '...' if len(row['Metric']) > 20 else row['Metric'],
-                    'Rate': int(percentages[0])
-                })
-        
-        if success_rates:
-            rates_df = pd.DataFrame(success_rates)
-            
-            # Bar chart for success rates
-            fig.add_trace(
-                go.Bar(x=rates_df['Metric'], y=rates_df['Rate'], name='Success Rate',
-                      marker_color='lightblue'),
-                row=1, col=1
-            )
-            
-            # Line chart for trends
-            fig.add_trace(
-                go.Scatter(x=rates_df['Metric'], y=rates_df['Rate'], mode='lines+markers',
-                         name='Trend', line=dict(color='orange', width=2)),
-                row=1, col=2
-            )
-            
-            # Pie chart for distribution
-            fig.add_trace(
-                go.Pie(labels=rates_df['Metric'], values=rates_df['Rate'], name='Distribution'),
-                row=2, col=1
-            )
-            
-            # Scatter plot for correlation
-            fig.add_trace(
-                go.Scatter(x=list(range(len(rates_df))), y=rates_df['Rate'], 
-                         mode='markers', marker=dict(size=12, color=rates_df['Rate'],
-                         colorscale='Viridis', showscale=True),
-                         name='Performance'),
-                row=2, col=2
-            )
-        
-        fig.update_layout(height=600, showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(self._get_category_figure('student_success_roi', df, persona), use_container_width=True)
     
     def _render_grant_compliance_charts(self, df: pd.DataFrame, persona: str):
         """Render grant compliance visualizations"""
         st.markdown("##### 🏛️ Grant Compliance Dashboard")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Compliance gauge chart
-            compliance_metrics = []
-            for _, row in df.iterrows():
-                import re
-                percentages = re.findall(r'(\d+)%', row['Example'])
-                if percentages and 'Compliance' in row['Metric']:
-                    avg_compliance = sum(int(p) for p in percentages) / len(percentages)
-                    
-                    fig = go.Figure(go.Indicator(
-                        mode = "gauge+number+delta",
-                        value = avg_compliance,
-                        domain = {'x': [0, 1], 'y': [0, 1]},
-                        title = {'text': "Overall Compliance Rate"},
-                        delta = {'reference': 90, 'increasing': {'color': "green"}},
-                        gauge = {
-                            'axis': {'range': [None, 100]},
-                            'bar': {'color': "#2ca02c"},
-                            'steps': [
-                                {'range': [0, 70], 'color': "#ffebee"},
-                                {'range': [70, 90], 'color': "#fff3cd"},
-                                {'range': [90, 100], 'color': "#d4edda"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "red", 'width': 4},
-                                'thickness': 0.75,
-                                'value': 95
-                            }
-                        }
-                    ))
-                    fig.update_layout(height=400)
-                    st.plotly_chart(fig, use_container_width=True)
-                    break
-        
-        with col2:
-            # Risk assessment matrix
-            risk_data = []
-            for _, row in df.iterrows():
-                if 'Risk' in row['Metric'] or 'Audit' in row['Metric']:
-                    import re
-                    # Extract numeric values
-                    numbers = re.findall(r'(\d+)', row['Example'])
-                    if numbers:
-                        risk_data.append({
-                            'Category': row['Metric'][:20],
-                            'Risk Level': int(numbers[0])
-                        })
-            
-            if risk_data:
-                risk_df = pd.DataFrame(risk_data)
-                fig = px.bar(risk_df, x='Category', y='Risk Level',
-                           title='Risk Assessment by Category',
-                           color='Risk Level',
-                           color_continuous_scale=['green', 'yellow', 'red'])
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+        fig = self._get_category_figure('grant_compliance', df, persona)
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True)
     
     def _render_resource_maximization_charts(self, df: pd.DataFrame, persona: str):
         """Render resource maximization visualizations"""
         st.markdown("##### 💰 Resource Optimization Analysis")
-        
-        # Create comprehensive resource analysis
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Resource Allocation', 'Efficiency Trends'),
-            specs=[[{'type': 'pie'}, {'type': 'bar'}]]
-        )
-        
-        # Extract ratio/percentage data
-        allocation_data = []
-        for _, row in df.iterrows():
-            import re
-            if 'Ratio' in row['Metric'] or '%' in row['Example']:
-                percentages = re.findall(r'(\d+)', row['Example'])
-                if percentages:
-                    allocation_data.append({
-                        'Category': row['Metric'][:25],
-                        'Value': int(percentages[0])
-                    })
-        
-        if allocation_data:
-            alloc_df = pd.DataFrame(allocation_data)
-            
-            # Pie chart for allocation
-            fig.add_trace(
-                go.Pie(labels=alloc_df['Category'], values=alloc_df['Value'],
-                      hole=0.3),
-                row=1, col=1
-            )
-            
-            # Bar chart for comparison
-            fig.add_trace(
-                go.Bar(x=alloc_df['Category'], y=alloc_df['Value'],
-                      marker_color='lightgreen'),
-                row=1, col=2
-            )
-        
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(self._get_category_figure('resource_maximization', df, persona), use_container_width=True)
     
     def _format_category_name(self, category: str) -> str:
         """Format category names for display"""
-        return category.replace('_', ' ').title()
+        return self._display_names.get(category) or _format_category_label(category)
     
     def render_institutional_hbcu_view(self):
         """Render comprehensive HBCU institutional dashboard with rich visualizations"""
@@ -460,51 +671,57 @@ class HBCUMetricsIntegrator:
         st.markdown("## Institutional Performance Analysis")
         
         # Create tabs for each category
-        category_tabs = st.tabs([self._format_category_name(cat) for cat in self.hbcu_metrics.keys()])
+        category_labels = list(self._display_names.values())
+        category_tabs = st.tabs(category_labels)
         
-        for tab, (category, df) in zip(category_tabs, self.hbcu_metrics.items()):
+        for tab, label, (category, df) in zip(category_tabs, category_labels, self.hbcu_metrics.items()):
             with tab:
-                # Render full visualization for each category
-                self._render_category_visualization(category, df, 'institutional')
-                
-                # Show detailed metrics table
-                st.markdown("### Detailed Metrics")
-                st.dataframe(df, use_container_width=True, hide_index=True)
-                
-                # Add download button for each category
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    f"📥 Download {self._format_category_name(category)} Data",
-                    csv,
-                    f"pqc_{category}_metrics.csv",
-                    "text/csv",
-                    key=f"download_{category}"
-                )
+                self._render_institutional_category(category, label, df)
         
         # Comparative analysis section
         st.markdown("## Comparative Analysis")
         self._render_comparative_analysis()
     
+    @st.fragment
+    def _render_institutional_category(self, category: str, label: str, df: pd.DataFrame):
+        """Render one institutional tab body (as a fragment, so the download button
+        reruns only this tab rather than every category)"""
+        # Render full visualization for each category
+        self._render_category_visualization(category, df, 'institutional')
+        
+        # Show detailed metrics table
+        st.markdown("### Detailed Metrics")
+        st.dataframe(df, use_container_width=True, hide_index=True, height=300,
+                     column_config=HBCU_TABLE_COLUMN_CONFIG)
+        
+        # Add download button for each category
+        st.download_button(
+            f"📥 Download {label} Data",
+            self._csv_blobs[category],
+            f"pqc_{category}_metrics.csv",
+            "text/csv",
+            key=f"download_{category}"
+        )
+    
     def _render_comparative_analysis(self):
         """Render comparative analysis across all HBCU metrics"""
+        import plotly.express as px
         
-        # Combine key metrics from all categories
-        all_metrics = []
+        # Combine key metrics (top 2 from each category), extracting the first numeric value
+        parts = []
         for category, df in self.hbcu_metrics.items():
-            for _, row in df.head(2).iterrows():  # Take top 2 from each category
-                import re
-                # Extract first numeric value
-                numbers = re.findall(r'(\d+)', row['Example'])
-                if numbers:
-                    all_metrics.append({
-                        'Category': self._format_category_name(category),
-                        'Metric': row['Metric'][:30],
-                        'Value': int(numbers[0])
-                    })
-        
-        if all_metrics:
-            metrics_df = pd.DataFrame(all_metrics)
-            
+            top = df.head(2)
+            numbers = _extract_first(top['Example'], _NUMBER_RE)
+            has_number = numbers.notna()
+            parts.append(pd.DataFrame({
+                'Category': self._format_category_name(category),
+                'Metric': _truncate_labels(top['Metric'][has_number], 30).to_numpy(),
+                'Value': numbers[has_number].astype(int).to_numpy()
+            }))
+        
+        metrics_df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        
+        if not metrics_df.empty:
             # Create comprehensive comparison chart
             fig = px.sunburst(metrics_df, 
                             path=['Category', 'Metric'], 
@@ -516,12 +733,25 @@ class HBCUMetricsIntegrator:
             st.plotly_chart(fig, use_container_width=True)
 
 # Integration helper functions remain the same...
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_hbcu_integrator(files_signature: tuple) -> HBCUMetricsIntegrator:
+    """Integrator for one version of the HBCU files (max_entries=1 drops the superseded one)"""
+    return HBCUMetricsIntegrator(files_signature)
+
+def get_hbcu_integrator() -> HBCUMetricsIntegrator:
+    """Integrator instance shared across reruns and sessions, rebuilt when an HBCU file changes"""
+    return _get_hbcu_integrator(_hbcu_files_signature(HBCU_METRICS_DIR))
+
 def integrate_hbcu_metrics_into_persona(persona_dashboard_func):
     """Decorator to integrate HBCU metrics into existing persona dashboards"""
     def wrapper(*args, **kwargs):
         result = persona_dashboard_func(*args, **kwargs)
-        integrator = HBCUMetricsIntegrator()
+        integrator = get_hbcu_integrator()
         persona_name = kwargs.get('persona', 'unknown')
         integrator.render_hbcu_dashboard_section(persona_name)
         return result
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+if __name__ == "__main__":
+    convert_hbcu_csvs_to_parquet()
+    print(f"✅ Parquet copies written to {HBCU_METRICS_DIR}")
@@ -3,15 +3,29 @@ ISSA Theme Configuration - Professional Finance Palette
 Theme configuration file for ISSA dashboards
 """
 
+import re
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.io as pio
+from types import MappingProxyType
+
+# CSS minification patterns
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};:,])\s*')
+
+class _ColorLookup(dict):
+    """Palette mapping that answers unknown color names with black"""
+    
+    def __missing__(self, key):
+        return "#000000"
 
 class ISSATheme:
     """ISSA Dashboard Theme Configuration - Professional Finance Edition"""
     
-    # Professional Finance/ISSA Color Palette
-    PALETTE = {
+    # Pure classmethod container - no per-instance __dict__
+    __slots__ = ()
+    
+    # Professional Finance/ISSA Color Palette (read-only)
+    PALETTE = MappingProxyType({
         # Layout Colors
         "primary_bg": "#F6F8FA",     # Neutral, calm base background
         "sidebar_bg": "#223A5E",     # Deep navy for left panel/sidebar
@@ -36,16 +50,49 @@ class ISSATheme:
         
         # Highlight/Selection
         "highlight": "#E8FAF4",      # For selected rows, focus effects
-    }
+    })
+    
+    # Plotly trace color order
+    _COLORWAY = (
+        PALETTE["accent"],
+        PALETTE["success"],
+        PALETTE["warning"],
+        PALETTE["error"],
+        PALETTE["info"],
+        PALETTE["accent2"],
+        PALETTE["inactive"]
+    )
+    
+    # Helper to get a specific color (unknown names give black) - bound straight to the
+    # lookup dict so each call is a C-level dict access with no Python frame
+    get_color = staticmethod(_ColorLookup(PALETTE).__getitem__)
     
     # Typography
     FONT_FAMILY = "'Open Sans', 'Roboto', 'Arial', sans-serif"
     FONT_FAMILY_HEADING = "'Montserrat', 'Roboto', 'Arial', sans-serif"
     
+    # HTML snippet templates (static parts resolved once at class creation)
+    _HEADER_TEMPLATE = (
+        '<div class="dashboard-header">'
+        '<h1 style="margin: 0; font-size: 2.5rem; color: white; font-family: ' + FONT_FAMILY_HEADING + ';">{title}</h1>'
+        '{subtitle_html}'
+        '</div>'
+    )
+    _SUBTITLE_TEMPLATE = '<p style="margin: 10px 0; font-size: 1.2rem; font-weight: 300; color: white;">{subtitle}</p>'
+    _BOX_TEMPLATE = '<div class="{box_type}-box">{content}</div>'
+    BOX_TYPES = frozenset(("info", "warning", "success", "error"))
+    
+    # Generated once per process - the CSS and Plotly template never change at runtime
+    _CSS_CACHED = None
+    _PLOTLY_READY = False
+    
     @classmethod
     def get_css(cls):
         """Generate CSS for Streamlit styling with improved colors"""
-        return f"""
+        if cls._CSS_CACHED is not None:
+            return cls._CSS_CACHED
+        
+        cls._CSS_CACHED = f"""
         <style>
         /* Global Styles */
         .stApp {{
@@ -84,45 +131,23 @@ class ISSATheme:
             box-shadow: 0 1px 3px rgba(0,0,0,0.05);
         }}
         
-        /* Success Box */
-        .success-box {{
-            background-color: {cls.PALETTE['highlight']};
-            border-left: 4px solid {cls.PALETTE['success']};
+        /* Status Boxes - one shared rule, each type only sets its colors */
+        .success-box, .warning-box, .error-box, .info-box {{
+            background-color: var(--box-bg);
+            border-left: 4px solid var(--box-accent);
             padding: 15px;
             border-radius: 6px;
             margin: 10px 0;
             color: {cls.PALETTE['font_main']};
         }}
         
-        /* Warning Box */
-        .warning-box {{
-            background-color: #FFF8E1;
-            border-left: 4px solid {cls.PALETTE['warning']};
-            padding: 15px;
-            border-radius: 6px;
-            margin: 10px 0;
-            color: {cls.PALETTE['font_main']};
-        }}
-        
-        /* Error Box */
-        .error-box {{
-            background-color: #FFEBEE;
-            border-left: 4px solid {cls.PALETTE['error']};
-            padding: 15px;
-            border-radius: 6px;
-            margin: 10px 0;
-            color: {cls.PALETTE['font_main']};
-        }}
-        
-        /* Info Box */
+        .success-box {{ --box-bg: {cls.PALETTE['highlight']}; --box-accent: {cls.PALETTE['success']}; }}
+        .warning-box {{ --box-bg: #FFF8E1; --box-accent: {cls.PALETTE['warning']}; }}
+        .error-box {{ --box-bg: #FFEBEE; --box-accent: {cls.PALETTE['error']}; }}
         .info-box {{
-            background-color: {cls.PALETTE['card_bg']};
-            border-left: 4px solid {cls.PALETTE['info']};
-            padding: 15px;
-            border-radius: 6px;
-            margin: 10px 0;
+            --box-bg: {cls.PALETTE['card_bg']};
+            --box-accent: {cls.PALETTE['info']};
             box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-            color: {cls.PALETTE['font_main']};
         }}
         
         /* Buttons */
@@ -186,79 +211,102 @@ class ISSATheme:
         }}
         </style>
         """
+        # Minify once (comments, whitespace) - the string is re-sent to the browser on every rerun
+        css = _CSS_COMMENT_RE.sub('', cls._CSS_CACHED)
+        css = _CSS_WHITESPACE_RE.sub(' ', css)
+        cls._CSS_CACHED = _CSS_PUNCTUATION_RE.sub(r'\1', css).strip()
+        return cls._CSS_CACHED
     
     @classmethod
     def setup_plotly_theme(cls):
         """Configure Plotly theme with improved finance colors"""
-        pio.templates["issa_finance"] = go.layout.Template(
-            layout=go.Layout(
-                paper_bgcolor=cls.PALETTE["primary_bg"],
-                plot_bgcolor=cls.PALETTE["card_bg"],
-                font=dict(
-                    family=cls.FONT_FAMILY,
-                    color=cls.PALETTE["font_main"],
-                    size=14
-                ),
-                title=dict(
-                    font=dict(
-                        family=cls.FONT_FAMILY_HEADING,
-                        size=22,
-                        color=cls.PALETTE["font_heading"]
-                    )
-                ),
-                colorway=[
-                    cls.PALETTE["accent"], 
-                    cls.PALETTE["success"],
-                    cls.PALETTE["warning"], 
-                    cls.PALETTE["error"],
-                    cls.PALETTE["info"],
-                    cls.PALETTE["accent2"],
-                    cls.PALETTE["inactive"]
-                ],
-                xaxis=dict(
-                    gridcolor=cls.PALETTE["divider"],
-                    tickfont=dict(color=cls.PALETTE["font_main"]),
-                    title_font=dict(color=cls.PALETTE["font_main"])
-                ),
-                yaxis=dict(
-                    gridcolor=cls.PALETTE["divider"],
-                    tickfont=dict(color=cls.PALETTE["font_main"]),
-                    title_font=dict(color=cls.PALETTE["font_main"])
-                ),
-                hoverlabel=dict(
-                    bgcolor=cls.PALETTE["card_bg"],
-                    bordercolor=cls.PALETTE["accent"],
-                    font_size=14,
-                    font_family=cls.FONT_FAMILY,
-                    font_color=cls.PALETTE["font_main"]
-                )
-            )
-        )
+        if cls._PLOTLY_READY:
+            return
+        
+        # Imported here so pages that only need the CSS never load Plotly
+        import plotly.io as pio
+        
+        # Plain dict spec - the registry coerces it once, without building go.Layout objects first
+        pio.templates["issa_finance"] = {
+            "layout": {
+                "paper_bgcolor": cls.PALETTE["primary_bg"],
+                "plot_bgcolor": cls.PALETTE["card_bg"],
+                "font": {
+                    "family": cls.FONT_FAMILY,
+                    "color": cls.PALETTE["font_main"],
+                    "size": 14
+                },
+                "title": {
+                    "font": {
+                        "family": cls.FONT_FAMILY_HEADING,
+                        "size": 22,
+                        "color": cls.PALETTE["font_heading"]
+                    }
+                },
+                "colorway": cls._COLORWAY,
+                "xaxis": {
+                    "gridcolor": cls.PALETTE["divider"],
+                    "tickfont": {"color": cls.PALETTE["font_main"]},
+                    "title": {"font": {"color": cls.PALETTE["font_main"]}}
+                },
+                "yaxis": {
+                    "gridcolor": cls.PALETTE["divider"],
+                    "tickfont": {"color": cls.PALETTE["font_main"]},
+                    "title": {"font": {"color": cls.PALETTE["font_main"]}}
+                },
+                "hoverlabel": {
+                    "bgcolor": cls.PALETTE["card_bg"],
+                    "bordercolor": cls.PALETTE["accent"],
+                    "font": {
+                        "size": 14,
+                        "family": cls.FONT_FAMILY,
+                        "color": cls.PALETTE["font_main"]
+                    }
+                }
+            }
+        }
         pio.templates.default = "issa_finance"
+        cls._PLOTLY_READY = True
     
     @classmethod
     def apply_theme(cls):
         """Apply complete theme to Streamlit app"""
-        st.markdown(cls.get_css(), unsafe_allow_html=True)
+        # The <style> element must be emitted on every rerun - Streamlit drops any element a
+        # rerun does not re-send, so gating this on session state would unstyle the page after
+        # the first interaction. The CSS string itself is cached, and an unchanged element
+        # at the same position is not re-rendered by the browser. st.html passes the block
+        # through without a Markdown parse (older Streamlit falls back to st.markdown).
+        if hasattr(st, "html"):
+            st.html(cls.get_css())
+        else:
+            st.markdown(cls.get_css(), unsafe_allow_html=True)
         cls.setup_plotly_theme()
     
     @classmethod
-    def get_color(cls, color_name):
-        """Helper method to get a specific color"""
-        return cls.PALETTE.get(color_name, "#000000")
+    def init_app(cls, *, page_title, page_icon="🎓", layout="wide", initial_sidebar_state="auto"):
+        """Single entry point for page setup: page config, theme CSS and Plotly template.
+        
+        Safe to call on every rerun - the CSS is rebuilt only once per process and the
+        Plotly template is registered only once, but the page config and <style> element
+        are re-sent each run because Streamlit drops anything a rerun does not emit.
+        """
+        st.set_page_config(
+            page_title=page_title,
+            page_icon=page_icon,
+            layout=layout,
+            initial_sidebar_state=initial_sidebar_state
+        )
+        cls.apply_theme()
     
     @classmethod
     def create_header(cls, title, subtitle=None):
         """Create a styled header with improved colors"""
-        subtitle_html = f'<p style="margin: 10px 0; font-size: 1.2rem; font-weight: 300; color: white;">{subtitle}</p>' if subtitle else ''
-        return f"""
-        <div class="dashboard-header">
-            <h1 style="margin: 0; font-size: 2.5rem; color: white; font-family: {cls.FONT_FAMILY_HEADING};">{title}</h1>
-            {subtitle_html}
-        </div>
-        """
+        subtitle_html = cls._SUBTITLE_TEMPLATE.format(subtitle=subtitle) if subtitle else ''
+        return cls._HEADER_TEMPLATE.format(title=title, subtitle_html=subtitle_html)
     
     @classmethod
     def create_info_box(cls, content, box_type="info"):
         """Create a styled info/warning/success/error box"""
-        return f'<div class="{box_type}-box">{content}</div>'
\ No newline at end of file
+        if box_type not in cls.BOX_TYPES:
+            box_type = "info"
+        return cls._BOX_TEMPLATE.format(box_type=box_type, content=content)
@@ -3,19 +3,45 @@ Metric Intelligence Module - AI Enhancement Layer for ISSA
 Provides intelligent analysis and predictions for all metric types
 """
 
+import re
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 import logging
-from dataclasses import dataclass
+import heapq
+from operator import attrgetter
+from functools import lru_cache
+from dataclasses import dataclass, fields
 import json
 
+# Optional JIT for the per-column statistics kernel
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional fast JSON encoder with native NumPy support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _json_default(value: Any) -> Any:
+    """Encode the NumPy values insights carry in data_points"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+@dataclass(slots=True)
 class MetricInsight:
     """Data class for metric insights"""
     metric_name: str
@@ -26,8 +52,15 @@ class MetricInsight:
     impact_score: float
     recommended_actions: List[str]
     data_points: Dict[str, Any]
+    
+    def to_json(self) -> str:
+        """Serialize the insight, NumPy arrays in data_points included"""
+        payload = {field.name: getattr(self, field.name) for field in fields(self)}
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(payload, default=_json_default)
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationOpportunity:
     """Data class for optimization opportunities"""
     title: str
@@ -40,6 +73,170 @@ class OptimizationOpportunity:
     prerequisites: List[str]
     success_metrics: List[str]
 
+# Anomalous values kept verbatim on an insight; the rest are summarized
+MAX_ANOMALY_SAMPLE = 10
+
+# Separators between words in metric names ('vendor_spend', 'infrastructure-system', 'vendor spend')
+_METRIC_NAME_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+def _metric_name_tokens(metric_name: str) -> frozenset:
+    """Lowercase words of a metric name, for keyword matching"""
+    return frozenset(_METRIC_NAME_SEPARATOR_RE.split(metric_name.lower()))
+
+@lru_cache(maxsize=256)
+def _numeric_positions(dtypes: Tuple) -> np.ndarray:
+    """Positions of the numeric dtypes in a frame's dtype tuple (select_dtypes run on an empty frame)"""
+    probe = pd.DataFrame({i: pd.Series(dtype=dtype) for i, dtype in enumerate(dtypes)})
+    return probe.select_dtypes(include=[np.number]).columns.to_numpy(dtype=np.intp)
+
+def _numeric_block(data: pd.DataFrame) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+    """Numeric columns of a frame as one float64 array plus its non-NaN mask"""
+    # Keyed on the dtypes rather than the frame, so frames sharing a schema share the
+    # lookup and a column changing dtype is never served a stale entry
+    positions = _numeric_positions(tuple(data.dtypes))
+    numeric_cols = data.columns[positions]
+    values = data.iloc[:, positions].to_numpy(dtype=np.float64, na_value=np.nan)
+    return numeric_cols, values, ~np.isnan(values)
+
+def _linear_fit(values: np.ndarray, valid: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Least-squares line for every column at once, fitted over each column's non-NaN values
+    (x is the position among those values, as with polyfit on a dropna'd column).
+    
+    Returns per-column (count, slope, intercept, mean, last value).
+    """
+    n = valid.sum(axis=0)
+    x = np.cumsum(valid, axis=0) - 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = np.where(valid, x, 0.0).sum(axis=0) / n
+        y_mean = np.where(valid, values, 0.0).sum(axis=0) / n
+        dx = np.where(valid, x - x_mean, 0.0)
+        dy = np.where(valid, values - y_mean, 0.0)
+        slope = (dx * dy).sum(axis=0) / (dx * dx).sum(axis=0)
+        intercept = y_mean - slope * x_mean
+    
+    # Last non-NaN value in each column
+    if values.shape[0]:
+        last_row = values.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+        last = values[last_row, np.arange(values.shape[1])]
+    else:
+        last = np.full(values.shape[1], np.nan)
+    return n, slope, intercept, y_mean, last
+
+def _z_scores(values: np.ndarray, valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-column sample std and absolute z-scores (NaN where undefined), ignoring NaN entries"""
+    n = valid.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(valid, values, 0.0).sum(axis=0) / n
+        deviations = np.where(valid, values - mean, 0.0)
+        std = np.sqrt((deviations * deviations).sum(axis=0) / (n - 1))
+        return std, np.abs((values - mean) / std)
+
+if NUMBA_AVAILABLE:
+    _i8_vector = types.int64[::1]
+    _f8_vector = types.float64[::1]
+    _KERNEL_RESULT = types.Tuple((_i8_vector, _f8_vector, _f8_vector, _f8_vector,
+                                  _f8_vector, _f8_vector, _i8_vector, _f8_vector))
+    
+    # Explicit signatures compile at import (no first-call JIT pause) and the cache keeps them
+    # across restarts. The read-only variant covers arrays from to_numpy() under copy-on-write.
+    # fastmath without 'nnan'/'ninf': the kernel relies on NaN checks to skip missing values
+    @njit([_KERNEL_RESULT(types.Array(types.float64, 2, 'C', readonly=readonly), types.float64)
+           for readonly in (False, True)],
+          parallel=True, cache=True, error_model='numpy',
+          fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _trend_and_anomaly_stats(values, z_threshold):
+        """Fused per-column kernel: fit, mean/std and z-score tally without NumPy temporaries"""
+        n_rows, n_cols = values.shape
+        counts = np.zeros(n_cols, dtype=np.int64)
+        slopes = np.full(n_cols, np.nan)
+        intercepts = np.full(n_cols, np.nan)
+        means = np.full(n_cols, np.nan)
+        last_values = np.full(n_cols, np.nan)
+        stds = np.full(n_cols, np.nan)
+        z_counts = np.zeros(n_cols, dtype=np.int64)
+        max_z = np.full(n_cols, -np.inf)
+        
+        for j in prange(n_cols):
+            # Pass 1: count, sum and last value of the non-NaN entries
+            n = 0
+            total = 0.0
+            for i in range(n_rows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    total += v
+                    last_values[j] = v
+                    n += 1
+            counts[j] = n
+            if n == 0:
+                continue
+            
+            # Pass 2: centered sums; x is the position among the non-NaN values
+            y_mean = total / n
+            x_mean = (n - 1) / 2.0
+            sxx = 0.0
+            sxy = 0.0
+            syy = 0.0
+            k = 0
+            for i in range(n_rows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    dx = k - x_mean
+                    dy = v - y_mean
+                    sxx += dx * dx
+                    sxy += dx * dy
+                    syy += dy * dy
+                    k += 1
+            slope = sxy / sxx
+            std = np.sqrt(syy / (n - 1))
+            means[j] = y_mean
+            slopes[j] = slope
+            intercepts[j] = y_mean - slope * x_mean
+            stds[j] = std
+            
+            # Pass 3: tally |z| above the threshold and track the largest
+            for i in range(n_rows):
+                v = values[i, j]
+                if not np.isnan(v):
+                    z = abs((v - y_mean) / std)
+                    if z > z_threshold:
+                        z_counts[j] += 1
+                    if z > max_z[j]:
+                        max_z[j] = z
+        
+        return counts, slopes, intercepts, means, last_values, stds, z_counts, max_z
+
+def _column_stats(values: np.ndarray, valid: np.ndarray, z_threshold: float) -> Tuple[np.ndarray, ...]:
+    """Trend fit and z-score summary for every column.
+    
+    Returns per-column (count, slope, intercept, mean, last value, std, count of |z| above
+    the threshold, max |z|). Uses the numba kernel when available, NumPy otherwise.
+    """
+    if NUMBA_AVAILABLE:
+        return _trend_and_anomaly_stats(np.ascontiguousarray(values, dtype=np.float64), float(z_threshold))
+    
+    counts, slopes, intercepts, means, last_values = _linear_fit(values, valid)
+    stds, z = _z_scores(values, valid)
+    z_counts = (z > z_threshold).sum(axis=0)
+    max_z = np.max(np.where(valid, z, -np.inf), axis=0, initial=-np.inf)
+    return counts, slopes, intercepts, means, last_values, stds, z_counts, max_z
+
+def _quantile_threshold(values: np.ndarray, q: float) -> float:
+    """Linearly interpolated quantile of the non-NaN values (same as Series.quantile),
+    found by O(n) selection with np.partition instead of a full sort"""
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return np.nan
+    position = q * (values.size - 1)
+    lower = int(position)
+    upper = min(lower + 1, values.size - 1)
+    selected = np.partition(values, (lower, upper))
+    return selected[lower] + (selected[upper] - selected[lower]) * (position - lower)
+
+def _numeric_summary(data: pd.DataFrame, z_threshold: float) -> Tuple[pd.Index, np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+    """Numeric block of a frame plus its per-column statistics, shared by the analysis models"""
+    numeric_cols, values, valid = _numeric_block(data)
+    return numeric_cols, values, valid, _column_stats(values, valid, z_threshold)
+
 class MetricIntelligenceEngine:
     """AI-powered intelligence engine for metric analysis"""
     
@@ -51,6 +248,20 @@ class MetricIntelligenceEngine:
             'optimization_scoring': self._score_optimization_opportunities
         }
         
+        # Persona-specific optimization patterns and the metric-name keywords that trigger them
+        self.persona_keywords = {
+            'cfo': frozenset({'cost', 'spend', 'budget'}),
+            'cio': frozenset({'digital', 'transformation'}),
+            'cto': frozenset({'infrastructure', 'system'}),
+            'pm': frozenset({'project', 'delivery'})
+        }
+        self.optimization_identifiers = {
+            'cfo': self._identify_financial_optimizations,
+            'cio': self._identify_strategic_optimizations,
+            'cto': self._identify_operational_optimizations,
+            'pm': self._identify_project_optimizations
+        }
+        
         # Intelligence thresholds
         self.thresholds = {
             'significant_variance': 0.15,  # 15% variance threshold
@@ -86,6 +297,89 @@ class MetricIntelligenceEngine:
                 'stakeholder_focus': 0.15
             }
         }
+        
+        # Message prefix for each persona's insights
+        self.persona_context = {
+            'cfo': "Financial Impact",
+            'cio': "Strategic Alignment",
+            'cto': "Operational Efficiency",
+            'pm': "Project Delivery"
+        }
+        
+        # Recommended action templates, built once and copied out per insight
+        self.trend_actions = {
+            ('cfo', 'increasing'): (
+                "Investigate cost increase drivers",
+                "Implement cost control measures",
+                "Review vendor contracts for optimization",
+                "Consider budget reallocation strategies"
+            ),
+            ('cfo', 'decreasing'): (
+                "Validate cost reduction sustainability",
+                "Document cost optimization best practices",
+                "Reallocate savings to strategic initiatives",
+                "Monitor for potential service impacts"
+            ),
+            ('cio', 'increasing'): (
+                "Assess strategic alignment of growth trend",
+                "Evaluate scalability requirements",
+                "Plan for increased capacity needs",
+                "Monitor business value delivery"
+            ),
+            ('cio', 'decreasing'): (
+                "Investigate decline causes",
+                "Assess impact on strategic objectives",
+                "Consider intervention strategies",
+                "Review and adjust strategic roadmap"
+            ),
+            ('cto', 'increasing'): (
+                "Monitor system capacity and performance",
+                "Plan infrastructure scaling",
+                "Optimize resource utilization",
+                "Implement automated monitoring"
+            ),
+            ('cto', 'decreasing'): (
+                "Investigate performance issues",
+                "Review system efficiency metrics",
+                "Plan capacity optimization",
+                "Update monitoring thresholds"
+            )
+        }
+        self.default_trend_actions = ("Monitor trend continuation", "Analyze root causes", "Plan appropriate response")
+        
+        base_anomaly_actions = (
+            "Investigate root cause of anomalies",
+            "Validate data accuracy and completeness",
+            "Check for external factors or events"
+        )
+        self.anomaly_actions = {
+            'medium': base_anomaly_actions,
+            'high': base_anomaly_actions + (
+                "Implement immediate monitoring",
+                "Escalate to appropriate stakeholders",
+                "Create detailed incident report"
+            )
+        }
+        
+        self.prediction_actions = {
+            'increase': (
+                "Prepare for anticipated increase",
+                "Plan resource scaling strategies",
+                "Monitor leading indicators",
+                "Update forecasting models"
+            ),
+            'decrease': (
+                "Investigate potential decline causes",
+                "Develop mitigation strategies",
+                "Review current initiatives effectiveness",
+                "Plan corrective interventions"
+            ),
+            'moderate': (
+                "Continue current monitoring",
+                "Validate prediction accuracy over time",
+                "Refine prediction models"
+            )
+        }
     
     def analyze_metric(self, data: pd.DataFrame, persona: str, metric_name: str) -> List[MetricInsight]:
         """Generate comprehensive insights for a single metric"""
@@ -105,21 +399,22 @@ class MetricIntelligenceEngine:
             )]
         
         try:
+            # Extract the numeric columns once and share them across the models
+            # (frames under 3 rows are too short for any of the statistical models)
+            numeric = _numeric_summary(data, self.thresholds['anomaly_z_score']) if len(data) >= 3 else None
+            
             # Run all analysis models
             for model_name, model_func in self.analysis_models.items():
-                model_insights = model_func(data, persona, metric_name)
+                model_insights = model_func(data, persona, metric_name, numeric=numeric)
                 insights.extend(model_insights)
             
-            # Score and filter insights
-            insights = self._score_insights(insights, persona)
+            # Score, filter and add persona-specific context in one pass
+            insights = self._score_insights(insights, persona, add_context=True)
             
-            # Add persona-specific context
-            insights = self._add_persona_context(insights, persona)
-            
-            return sorted(insights, key=lambda x: x.impact_score, reverse=True)
+            return sorted(insights, key=attrgetter('impact_score'), reverse=True)
         
         except Exception as e:
-            logger.error(f"Error analyzing metric {metric_name}: {e}")
+            logger.error("Error analyzing metric %s: %s", metric_name, e)
             return [MetricInsight(
                 metric_name=metric_name,
                 persona=persona,
@@ -131,113 +426,127 @@ class MetricIntelligenceEngine:
                 data_points={'error': str(e)}
             )]
     
-    def _analyze_trends(self, data: pd.DataFrame, persona: str, metric_name: str) -> List[MetricInsight]:
-        """Analyze trends in metric data"""
+    def _analyze_trends(self, data: pd.DataFrame, persona: str, metric_name: str,
+                        numeric: Optional[Tuple] = None) -> List[MetricInsight]:
+        """Analyze trends in metric data (numeric: precomputed _numeric_summary of data)"""
         insights = []
         
-        # Find numeric columns
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_cols:
-            if len(data[col].dropna()) < 3:
-                continue
-                
-            # Calculate trend
-            values = data[col].dropna().values
-            if len(values) >= 3:
-                # Simple linear trend
-                x = np.arange(len(values))
-                trend = np.polyfit(x, values, 1)[0]
-                
-                # Determine trend significance
-                trend_pct = (trend * len(values)) / np.mean(values) * 100
-                
-                if abs(trend_pct) > 5:  # 5% change threshold
-                    trend_direction = "increasing" if trend > 0 else "decreasing"
-                    impact = abs(trend_pct) / 10  # Scale to 0-10
-                    
-                    # Generate recommendations based on trend and persona
-                    actions = self._generate_trend_actions(trend_direction, col, persona, trend_pct)
-                    
-                    insights.append(MetricInsight(
-                        metric_name=metric_name,
-                        persona=persona,
-                        insight_type='trend',
-                        message=f"{col} is {trend_direction} by {abs(trend_pct):.1f}% over time",
-                        confidence=min(abs(trend_pct) / 20, 1.0),  # Higher change = higher confidence
-                        impact_score=impact,
-                        recommended_actions=actions,
-                        data_points={
-                            'column': col,
-                            'trend_percentage': trend_pct,
-                            'trend_direction': trend_direction,
-                            'current_value': values[-1],
-                            'trend_coefficient': trend
-                        }
-                    ))
+        # Too few rows for any column to qualify
+        if len(data) < 3:
+            return insights
+        
+        # Fit every numeric column in one vectorized pass
+        if numeric is None:
+            numeric = _numeric_summary(data, self.thresholds['anomaly_z_score'])
+        numeric_cols, _, _, (counts, slopes, _, means, last_values, _, _, _) = numeric
+        
+        # Determine trend significance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend_pcts = (slopes * counts) / means * 100
+        significant = (counts >= 3) & (np.abs(trend_pcts) > 5)  # 5% change threshold
+        
+        for i in np.flatnonzero(significant):
+            col = numeric_cols[i]
+            trend = slopes[i]
+            trend_pct = trend_pcts[i]
+            trend_direction = "increasing" if trend > 0 else "decreasing"
+            impact = abs(trend_pct) / 10  # Scale to 0-10
+            
+            # Generate recommendations based on trend and persona
+            actions = self._generate_trend_actions(trend_direction, col, persona, trend_pct)
+            
+            insights.append(MetricInsight(
+                metric_name=metric_name,
+                persona=persona,
+                insight_type='trend',
+                message=f"{col} is {trend_direction} by {abs(trend_pct):.1f}% over time",
+                confidence=min(abs(trend_pct) / 20, 1.0),  # Higher change = higher confidence
+                impact_score=impact,
+                recommended_actions=actions,
+                data_points={
+                    'column': col,
+                    'trend_percentage': trend_pct,
+                    'trend_direction': trend_direction,
+                    'current_value': last_values[i],
+                    'trend_coefficient': trend
+                }
+            ))
         
         return insights
     
-    def _detect_anomalies(self, data: pd.DataFrame, persona: str, metric_name: str) -> List[MetricInsight]:
-        """Detect anomalies in metric data"""
+    def _detect_anomalies(self, data: pd.DataFrame, persona: str, metric_name: str,
+                          numeric: Optional[Tuple] = None) -> List[MetricInsight]:
+        """Detect anomalies in metric data (numeric: precomputed _numeric_summary of data)"""
         insights = []
         
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_cols:
-            values = data[col].dropna()
-            
-            if len(values) < 5:
-                continue
+        # Too few rows for any column to qualify
+        if len(data) < 5:
+            return insights
+        
+        # Z-score based anomaly detection over every numeric column at once
+        z_threshold = self.thresholds['anomaly_z_score']
+        if numeric is None:
+            numeric = _numeric_summary(data, z_threshold)
+        numeric_cols, values, _, (counts, _, _, means, _, stds, anomaly_counts, max_z_scores) = numeric
+        
+        for i in np.flatnonzero((counts >= 5) & (anomaly_counts > 0)):
+            col = numeric_cols[i]
+            col_values = values[:, i]
+            anomalies = col_values[np.abs((col_values - means[i]) / stds[i]) > z_threshold]
+            anomaly_count = int(anomaly_counts[i])
+            max_z = max_z_scores[i]
+            severity = "high" if max_z > 3 else "medium"
             
-            # Z-score based anomaly detection
-            z_scores = np.abs((values - values.mean()) / values.std())
-            anomalies = values[z_scores > self.thresholds['anomaly_z_score']]
+            actions = self._generate_anomaly_actions(col, persona, severity, anomalies)
             
-            if len(anomalies) > 0:
-                severity = "high" if z_scores.max() > 3 else "medium"
-                
-                actions = self._generate_anomaly_actions(col, persona, severity, anomalies.values)
-                
-                insights.append(MetricInsight(
-                    metric_name=metric_name,
-                    persona=persona,
-                    insight_type='anomaly',
-                    message=f"Detected {len(anomalies)} anomalies in {col} (severity: {severity})",
-                    confidence=min(z_scores.max() / 4, 1.0),
-                    impact_score=len(anomalies) * 2,  # More anomalies = higher impact
-                    recommended_actions=actions,
-                    data_points={
-                        'column': col,
-                        'anomaly_count': len(anomalies),
-                        'max_z_score': z_scores.max(),
-                        'anomaly_values': anomalies.tolist(),
-                        'severity': severity
-                    }
-                ))
+            insights.append(MetricInsight(
+                metric_name=metric_name,
+                persona=persona,
+                insight_type='anomaly',
+                message=f"Detected {anomaly_count} anomalies in {col} (severity: {severity})",
+                confidence=min(max_z / 4, 1.0),
+                impact_score=anomaly_count * 2,  # More anomalies = higher impact
+                recommended_actions=actions,
+                data_points={
+                    'column': col,
+                    'anomaly_count': anomaly_count,
+                    'max_z_score': max_z,
+                    'anomaly_sample': anomalies[:MAX_ANOMALY_SAMPLE].copy(),  # own array, not a view of the block
+                    'anomaly_min': float(anomalies.min()),
+                    'anomaly_max': float(anomalies.max()),
+                    'anomaly_mean': float(anomalies.mean()),
+                    'severity': severity
+                }
+            ))
         
         return insights
     
-    def _generate_predictions(self, data: pd.DataFrame, persona: str, metric_name: str) -> List[MetricInsight]:
-        """Generate predictions for metric values"""
+    def _generate_predictions(self, data: pd.DataFrame, persona: str, metric_name: str,
+                              numeric: Optional[Tuple] = None) -> List[MetricInsight]:
+        """Generate predictions for metric values (numeric: precomputed _numeric_summary of data)"""
         insights = []
         
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        # Too few rows for any column to qualify
+        if len(data) < 4:
+            return insights
         
-        for col in numeric_cols:
-            values = data[col].dropna()
-            
-            if len(values) < 4:
-                continue
+        # Fit every numeric column in one vectorized pass
+        if numeric is None:
+            numeric = _numeric_summary(data, self.thresholds['anomaly_z_score'])
+        numeric_cols, _, _, (counts, slopes, intercepts, _, last_values, _, _, _) = numeric
+        
+        # Simple linear prediction for next period, for every column as arrays
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            predicted = slopes * counts + intercepts
+            changes = np.where(last_values != 0, (predicted - last_values) / last_values * 100, 0.0)
+        
+        for i in np.flatnonzero(counts >= 4):
+            col = numeric_cols[i]
             
             try:
-                # Simple linear prediction for next period
-                x = np.arange(len(values))
-                coeffs = np.polyfit(x, values, 1)
-                predicted_next = coeffs[0] * len(values) + coeffs[1]
-                
-                current_value = values.iloc[-1] if len(values) > 0 else 0
-                prediction_change = (predicted_next - current_value) / current_value * 100 if current_value != 0 else 0
+                predicted_next = predicted[i]
+                current_value = last_values[i]
+                prediction_change = changes[i]
                 
                 if abs(prediction_change) > 10:  # Significant predicted change
                     confidence = 1 / (1 + abs(prediction_change) / 50)  # Higher change = lower confidence
@@ -262,43 +571,40 @@ class MetricIntelligenceEngine:
                     ))
             
             except Exception as e:
-                logger.warning(f"Prediction failed for {col}: {e}")
+                logger.warning("Prediction failed for %s: %s", col, e)
                 continue
         
         return insights
     
-    def _score_optimization_opportunities(self, data: pd.DataFrame, persona: str, metric_name: str) -> List[MetricInsight]:
-        """Identify optimization opportunities"""
-        insights = []
-        
-        # Persona-specific optimization patterns
-        if persona == 'cfo':
-            insights.extend(self._identify_financial_optimizations(data, metric_name))
-        elif persona == 'cio':
-            insights.extend(self._identify_strategic_optimizations(data, metric_name))
-        elif persona == 'cto':
-            insights.extend(self._identify_operational_optimizations(data, metric_name))
-        elif persona == 'pm':
-            insights.extend(self._identify_project_optimizations(data, metric_name))
-        
-        return insights
+    def _score_optimization_opportunities(self, data: pd.DataFrame, persona: str, metric_name: str,
+                                          numeric: Optional[Tuple] = None) -> List[MetricInsight]:
+        """Identify optimization opportunities (numeric is accepted for a uniform model signature)"""
+        identify = self.optimization_identifiers.get(persona)
+        if identify is None:
+            return []
+        
+        # Tokenize the metric name once for the identifier's keyword check
+        return identify(data, metric_name, _metric_name_tokens(metric_name))
     
-    def _identify_financial_optimizations(self, data: pd.DataFrame, metric_name: str) -> List[MetricInsight]:
+    def _identify_financial_optimizations(self, data: pd.DataFrame, metric_name: str,
+                                          metric_name_tokens: Optional[frozenset] = None) -> List[MetricInsight]:
         """CFO-specific optimization opportunities"""
         insights = []
         
         # Look for cost reduction opportunities
-        if 'cost' in metric_name.lower() or 'spend' in metric_name.lower() or 'budget' in metric_name.lower():
+        metric_name_tokens = metric_name_tokens or _metric_name_tokens(metric_name)
+        if metric_name_tokens & self.persona_keywords['cfo']:
             
             # Find high-spend categories
             if 'Annual Spend' in data.columns or 'Budget' in data.columns:
-                spend_col = 'Annual Spend' if 'Annual Spend' in data.columns else [col for col in data.columns if 'budget' in col.lower()][0] if any('budget' in col.lower() for col in data.columns) else None
+                spend_col = 'Annual Spend' if 'Annual Spend' in data.columns else next((col for col in data.columns if 'budget' in col.lower()), None)
                 
                 if spend_col and pd.api.types.is_numeric_dtype(data[spend_col]):
-                    high_spend_threshold = data[spend_col].quantile(0.8)
-                    high_spend_items = data[data[spend_col] > high_spend_threshold]
+                    spend = data[spend_col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    high_spend_mask = spend > _quantile_threshold(spend, 0.8)
+                    high_spend_total = spend[high_spend_mask].sum()
                     
-                    potential_savings = high_spend_items[spend_col].sum() * 0.1  # Assume 10% optimization potential
+                    potential_savings = high_spend_total * 0.1  # Assume 10% optimization potential
                     
                     insights.append(MetricInsight(
                         metric_name=metric_name,
@@ -314,8 +620,8 @@ class MetricIntelligenceEngine:
                             "Implement spend approval thresholds"
                         ],
                         data_points={
-                            'high_spend_count': len(high_spend_items),
-                            'total_high_spend': high_spend_items[spend_col].sum(),
+                            'high_spend_count': int(high_spend_mask.sum()),
+                            'total_high_spend': high_spend_total,
                             'potential_savings': potential_savings,
                             'optimization_percentage': 10
                         }
@@ -323,12 +629,14 @@ class MetricIntelligenceEngine:
         
         return insights
     
-    def _identify_strategic_optimizations(self, data: pd.DataFrame, metric_name: str) -> List[MetricInsight]:
+    def _identify_strategic_optimizations(self, data: pd.DataFrame, metric_name: str,
+                                          metric_name_tokens: Optional[frozenset] = None) -> List[MetricInsight]:
         """CIO-specific optimization opportunities"""
         insights = []
         
         # Look for strategic alignment opportunities
-        if 'digital' in metric_name.lower() or 'transformation' in metric_name.lower():
+        metric_name_tokens = metric_name_tokens or _metric_name_tokens(metric_name)
+        if metric_name_tokens & self.persona_keywords['cio']:
             insights.append(MetricInsight(
                 metric_name=metric_name,
                 persona='cio',
@@ -350,12 +658,14 @@ class MetricIntelligenceEngine:
         
         return insights
     
-    def _identify_operational_optimizations(self, data: pd.DataFrame, metric_name: str) -> List[MetricInsight]:
+    def _identify_operational_optimizations(self, data: pd.DataFrame, metric_name: str,
+                                            metric_name_tokens: Optional[frozenset] = None) -> List[MetricInsight]:
         """CTO-specific optimization opportunities"""
         insights = []
         
         # Look for operational efficiency opportunities
-        if 'infrastructure' in metric_name.lower() or 'system' in metric_name.lower():
+        metric_name_tokens = metric_name_tokens or _metric_name_tokens(metric_name)
+        if metric_name_tokens & self.persona_keywords['cto']:
             insights.append(MetricInsight(
                 metric_name=metric_name,
                 persona='cto',
@@ -377,12 +687,14 @@ class MetricIntelligenceEngine:
         
         return insights
     
-    def _identify_project_optimizations(self, data: pd.DataFrame, metric_name: str) -> List[MetricInsight]:
+    def _identify_project_optimizations(self, data: pd.DataFrame, metric_name: str,
+                                        metric_name_tokens: Optional[frozenset] = None) -> List[MetricInsight]:
         """PM-specific optimization opportunities"""
         insights = []
         
         # Look for project delivery optimizations
-        if 'project' in metric_name.lower() or 'delivery' in metric_name.lower():
+        metric_name_tokens = metric_name_tokens or _metric_name_tokens(metric_name)
+        if metric_name_tokens & self.persona_keywords['pm']:
             insights.append(MetricInsight(
                 metric_name=metric_name,
                 persona='pm',
@@ -406,139 +718,55 @@ class MetricIntelligenceEngine:
     
     def _generate_trend_actions(self, direction: str, column: str, persona: str, trend_pct: float) -> List[str]:
         """Generate actions based on trend analysis"""
-        actions = []
-        
-        if persona == 'cfo':
-            if 'cost' in column.lower() or 'spend' in column.lower():
-                if direction == 'increasing':
-                    actions = [
-                        "Investigate cost increase drivers",
-                        "Implement cost control measures",
-                        "Review vendor contracts for optimization",
-                        "Consider budget reallocation strategies"
-                    ]
-                else:
-                    actions = [
-                        "Validate cost reduction sustainability",
-                        "Document cost optimization best practices",
-                        "Reallocate savings to strategic initiatives",
-                        "Monitor for potential service impacts"
-                    ]
-        elif persona == 'cio':
-            if direction == 'increasing':
-                actions = [
-                    "Assess strategic alignment of growth trend",
-                    "Evaluate scalability requirements",
-                    "Plan for increased capacity needs",
-                    "Monitor business value delivery"
-                ]
-            else:
-                actions = [
-                    "Investigate decline causes",
-                    "Assess impact on strategic objectives", 
-                    "Consider intervention strategies",
-                    "Review and adjust strategic roadmap"
-                ]
-        elif persona == 'cto':
-            if direction == 'increasing':
-                actions = [
-                    "Monitor system capacity and performance",
-                    "Plan infrastructure scaling",
-                    "Optimize resource utilization",
-                    "Implement automated monitoring"
-                ]
-            else:
-                actions = [
-                    "Investigate performance issues",
-                    "Review system efficiency metrics",
-                    "Plan capacity optimization",
-                    "Update monitoring thresholds"
-                ]
-        
-        return actions or ["Monitor trend continuation", "Analyze root causes", "Plan appropriate response"]
+        direction = 'increasing' if direction == 'increasing' else 'decreasing'
+        
+        # CFO actions only apply to cost/spend columns
+        if persona == 'cfo' and not ('cost' in column.lower() or 'spend' in column.lower()):
+            actions = None
+        else:
+            actions = self.trend_actions.get((persona, direction))
+        
+        return list(actions or self.default_trend_actions)
     
     def _generate_anomaly_actions(self, column: str, persona: str, severity: str, anomaly_values: np.ndarray) -> List[str]:
         """Generate actions for anomaly detection"""
-        base_actions = [
-            "Investigate root cause of anomalies",
-            "Validate data accuracy and completeness",
-            "Check for external factors or events"
-        ]
-        
-        if severity == 'high':
-            base_actions.extend([
-                "Implement immediate monitoring",
-                "Escalate to appropriate stakeholders",
-                "Create detailed incident report"
-            ])
-        
-        return base_actions
+        return list(self.anomaly_actions['high' if severity == 'high' else 'medium'])
     
     def _generate_prediction_actions(self, column: str, persona: str, change_pct: float, predicted_value: float) -> List[str]:
         """Generate actions based on predictions"""
-        actions = []
-        
         if abs(change_pct) > 20:  # Significant change predicted
-            if change_pct > 0:  # Increase predicted
-                actions = [
-                    "Prepare for anticipated increase",
-                    "Plan resource scaling strategies",
-                    "Monitor leading indicators",
-                    "Update forecasting models"
-                ]
-            else:  # Decrease predicted
-                actions = [
-                    "Investigate potential decline causes",
-                    "Develop mitigation strategies",
-                    "Review current initiatives effectiveness",
-                    "Plan corrective interventions"
-                ]
-        else:
-            actions = [
-                "Continue current monitoring",
-                "Validate prediction accuracy over time",
-                "Refine prediction models"
-            ]
-        
-        return actions
+            return list(self.prediction_actions['increase' if change_pct > 0 else 'decrease'])
+        return list(self.prediction_actions['moderate'])
     
-    def _score_insights(self, insights: List[MetricInsight], persona: str) -> List[MetricInsight]:
-        """Apply persona-specific scoring to insights"""
+    def _score_insights(self, insights: List[MetricInsight], persona: str,
+                        add_context: bool = False) -> List[MetricInsight]:
+        """Apply persona-specific scoring to insights (and prefix the persona context to kept ones)"""
         
         weights = self.persona_weights.get(persona, self.persona_weights['cfo'])
+        context = self.persona_context.get(persona, "Business")
+        scored = []
         
         for insight in insights:
             # Adjust impact score based on persona priorities
             if insight.insight_type == 'optimization':
-                if 'cost' in insight.message.lower():
+                message = insight.message.lower()
+                if 'cost' in message:
                     insight.impact_score *= (1 + weights.get('cost_focus', 0))
-                elif 'strategic' in insight.message.lower():
+                elif 'strategic' in message:
                     insight.impact_score *= (1 + weights.get('strategic_focus', 0))
-                elif 'operational' in insight.message.lower():
+                elif 'operational' in message:
                     insight.impact_score *= (1 + weights.get('operational_focus', 0))
             
             # Filter low-confidence insights
             if insight.confidence < self.thresholds['confidence_minimum']:
                 insight.impact_score *= 0.5  # Reduce impact for low confidence
+            
+            if insight.impact_score > 0.5:  # Filter very low impact
+                if add_context:
+                    insight.message = f"[{context}] {insight.message}"
+                scored.append(insight)
         
-        return [i for i in insights if i.impact_score > 0.5]  # Filter very low impact
-    
-    def _add_persona_context(self, insights: List[MetricInsight], persona: str) -> List[MetricInsight]:
-        """Add persona-specific context to insights"""
-        
-        context_mapping = {
-            'cfo': "Financial Impact",
-            'cio': "Strategic Alignment",
-            'cto': "Operational Efficiency",
-            'pm': "Project Delivery"
-        }
-        
-        for insight in insights:
-            # Add persona context to message
-            context = context_mapping.get(persona, "Business")
-            insight.message = f"[{context}] {insight.message}"
-        
-        return insights
+        return scored
     
     def generate_executive_summary(self, all_insights: Dict[str, List[MetricInsight]], persona: str) -> Dict[str, Any]:
         """Generate executive summary of insights across all metrics"""
@@ -554,17 +782,18 @@ class MetricIntelligenceEngine:
         
         all_flat_insights = [insight for insights in all_insights.values() for insight in insights]
         
-        # Calculate summary statistics
+        # Calculate summary statistics over per-insight arrays
+        impacts = np.fromiter((insight.impact_score for insight in all_flat_insights),
+                              dtype=np.float64, count=len(all_flat_insights))
+        potential_values = np.fromiter(
+            (insight.data_points.get('potential_savings', 0) + insight.data_points.get('expected_benefit', 0)
+             for insight in all_flat_insights),
+            dtype=np.float64, count=len(all_flat_insights))
+        summary['high_impact_count'] = int((impacts > 7).sum())
+        summary['total_potential_value'] = float(potential_values.sum())
+        
+        # Categorize insights
         for insight in all_flat_insights:
-            if insight.impact_score > 7:
-                summary['high_impact_count'] += 1
-            
-            # Extract potential value from data points
-            potential_value = insight.data_points.get('potential_savings', 0)
-            potential_value += insight.data_points.get('expected_benefit', 0)
-            summary['total_potential_value'] += potential_value
-            
-            # Categorize insights
             if insight.insight_type == 'optimization':
                 summary['optimization_opportunities'].append({
                     'metric': insight.metric_name,
@@ -580,7 +809,7 @@ class MetricIntelligenceEngine:
                 })
         
         # Top recommendations by impact
-        top_insights = sorted(all_flat_insights, key=lambda x: x.impact_score, reverse=True)[:5]
+        top_insights = heapq.nlargest(5, all_flat_insights, key=attrgetter('impact_score'))
         summary['top_recommendations'] = [
             {
                 'message': insight.message,
@@ -608,25 +837,33 @@ def generate_optimization_recommendations(persona: str, all_metric_data: Dict[st
         if data is not None:
             all_insights[metric_name] = engine.analyze_metric(data, persona, metric_name)
     
-    # Convert insights to optimization opportunities
+    # Flatten (metric, insight) pairs into columns and filter them in one pass
+    pairs = [(metric_name, insight) for metric_name, insights in all_insights.items() for insight in insights]
+    insight_types = np.array([insight.insight_type for _, insight in pairs], dtype=object)
+    impacts = np.fromiter((insight.impact_score for _, insight in pairs), dtype=np.float64, count=len(pairs))
+    selected = np.flatnonzero((insight_types == 'optimization') & (impacts > 5))
+    
+    # Convert surviving insights to optimization opportunities
     opportunities = []
-    for metric_name, insights in all_insights.items():
-        for insight in insights:
-            if insight.insight_type == 'optimization' and insight.impact_score > 5:
-                opportunity = OptimizationOpportunity(
-                    title=insight.message.replace(f'[{persona.upper()}] ', ''),
-                    description=f"Based on analysis of {metric_name}: {insight.message}",
-                    category=insight.data_points.get('optimization_type', 'General'),
-                    potential_value=insight.data_points.get('potential_savings', insight.impact_score * 1000),
-                    implementation_effort='Medium',  # Default, could be enhanced
-                    timeline='3-6 months',  # Default, could be enhanced
-                    confidence=insight.confidence,
-                    prerequisites=["Data validation", "Stakeholder approval"],
-                    success_metrics=["Cost reduction", "Efficiency improvement"]
-                )
-                opportunities.append(opportunity)
+    for i in selected:
+        metric_name, insight = pairs[i]
+        opportunity = OptimizationOpportunity(
+            title=insight.message.replace(f'[{persona.upper()}] ', ''),
+            description=f"Based on analysis of {metric_name}: {insight.message}",
+            category=insight.data_points.get('optimization_type', 'General'),
+            potential_value=insight.data_points.get('potential_savings', insight.impact_score * 1000),
+            implementation_effort='Medium',  # Default, could be enhanced
+            timeline='3-6 months',  # Default, could be enhanced
+            confidence=insight.confidence,
+            prerequisites=["Data validation", "Stakeholder approval"],
+            success_metrics=["Cost reduction", "Efficiency improvement"]
+        )
+        opportunities.append(opportunity)
     
-    return sorted(opportunities, key=lambda x: x.potential_value, reverse=True)
+    # Highest potential value first; the stable sort keeps metric order among ties
+    potential_values = np.fromiter((opportunity.potential_value for opportunity in opportunities),
+                                   dtype=np.float64, count=len(opportunities))
+    return [opportunities[i] for i in np.argsort(-potential_values, kind='stable')]
 
 # Example usage and testing functions
 def test_intelligence_engine():
@@ -6,29 +6,116 @@ Automatically discovers and loads all metric modules with data source integratio
 import os
 import importlib
 import importlib.util
-import pandas as pd
+import json
 from pathlib import Path
 import sys
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from datetime import datetime
+from functools import lru_cache
+from types import ModuleType
+
+# pandas is imported on first use (see _pd) so importing the registry, e.g. to list
+# metrics, does not pay for pandas' import graph up front
+if TYPE_CHECKING:
+    import pandas as pd
+
+_pandas = None
+
+def _pd():
+    """The pandas module, imported on first call"""
+    global _pandas
+    if _pandas is None:
+        import pandas
+        _pandas = pandas
+    return _pandas
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import data source components
-try:
-    current_dir = Path(__file__).parent.parent
-    sys.path.append(str(current_dir))
-    
-    from integrations.data_connectors import DataSourceManager
-    from integrations.file_processors import ContractFileProcessor
-    from security.data_encryption import SecureDataHandler
-    DATA_INTEGRATION_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Data integration modules not available: {e}")
-    DATA_INTEGRATION_AVAILABLE = False
+# Metric modules already executed, keyed by module path
+_MODULE_CACHE: Dict[str, ModuleType] = {}
+
+# Parsed metric CSVs shared across registries, keyed by path -> (mtime_ns, DataFrame)
+_CSV_CACHE: Dict[str, Tuple[int, "pd.DataFrame"]] = {}
+
+def _read_csv_cached(path: str, mtime_ns: int) -> "pd.DataFrame":
+    """Parsed CSV shared across registries; an entry is replaced when the file's mtime changes"""
+    cached = _CSV_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = _CSV_CACHE[path] = (mtime_ns, _pd().read_csv(path))
+    return cached[1]
+
+# Data source components (integrations/security pull in HTTP and crypto stacks) are
+# imported on first use, not when the registry module is imported
+@lru_cache(maxsize=1)
+def _integration_classes() -> Optional[Tuple[type, type, type]]:
+    """(DataSourceManager, ContractFileProcessor, SecureDataHandler), or None if unavailable"""
+    try:
+        current_dir = Path(__file__).parent.parent
+        sys.path.append(str(current_dir))
+        
+        from integrations.data_connectors import DataSourceManager
+        from integrations.file_processors import ContractFileProcessor
+        from security.data_encryption import SecureDataHandler
+        return DataSourceManager, ContractFileProcessor, SecureDataHandler
+    except ImportError as e:
+        logger.warning(f"Data integration modules not available: {e}")
+        return None
+
+# On-disk cache of metric discovery, invalidated by the persona directories' mtimes
+DISCOVERY_CACHE_PATH = Path.home() / '.cache' / 'pqc_dashboard' / 'metrics_discovery.json'
+METRIC_PERSONAS = ('cfo', 'cio', 'cto', 'pm', 'hbcu')
+
+def _persona_dir_mtimes(metrics_dir: Path) -> Dict[str, Optional[int]]:
+    """st_mtime_ns of each persona directory (None when missing)"""
+    mtimes = {}
+    for persona in METRIC_PERSONAS:
+        try:
+            mtimes[persona] = (metrics_dir / persona).stat().st_mtime_ns
+        except OSError:
+            mtimes[persona] = None
+    return mtimes
+
+def _load_discovery_cache(metrics_dir: Path, mtimes: Dict[str, Optional[int]]):
+    """Cached discovery for metrics_dir, or None when missing, unreadable or stale"""
+    try:
+        with open(DISCOVERY_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cache.get('metrics_dir') != str(metrics_dir) or cache.get('mtimes') != mtimes:
+        return None
+    
+    return {
+        persona: {
+            metric_name: tuple(Path(path) if path else None for path in paths)
+            for metric_name, paths in persona_metrics.items()
+        }
+        for persona, persona_metrics in cache['metrics'].items()
+    }
+
+def _save_discovery_cache(metrics_dir: Path, mtimes: Dict[str, Optional[int]], discovered) -> None:
+    """Persist a discovery scan; failures only cost a rescan next time"""
+    cache = {
+        'metrics_dir': str(metrics_dir),
+        'mtimes': mtimes,
+        'metrics': {
+            persona: {
+                metric_name: [str(path) if path else None for path in paths]
+                for metric_name, paths in persona_metrics.items()
+            }
+            for persona, persona_metrics in discovered.items()
+        }
+    }
+    try:
+        DISCOVERY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(DISCOVERY_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not write metric discovery cache: {e}")
 
 class MetricRegistry:
     """Central registry for all dashboard metrics with data source integration"""
@@ -43,18 +130,41 @@ class MetricRegistry:
             'hbcu': {}
         }
         
-        # Data source integration
-        if DATA_INTEGRATION_AVAILABLE:
-            self.data_manager = DataSourceManager()
-            self.file_processor = ContractFileProcessor()
-            self.security_handler = SecureDataHandler()
-        else:
-            self.data_manager = None
-            self.file_processor = None
-            self.security_handler = None
+        # Data source integration, set up on first use (see _ensure_integrations)
+        self._integrations_available = None
+        self._data_manager = None
+        self._file_processor = None
+        self._security_handler = None
         
         self._discover_metrics()
     
+    def _ensure_integrations(self) -> bool:
+        """Import and construct the data source components once; True if available"""
+        if self._integrations_available is None:
+            classes = _integration_classes()
+            self._integrations_available = classes is not None
+            if classes is not None:
+                data_source_manager, contract_file_processor, secure_data_handler = classes
+                self._data_manager = data_source_manager()
+                self._file_processor = contract_file_processor()
+                self._security_handler = secure_data_handler()
+        return self._integrations_available
+    
+    @property
+    def data_manager(self):
+        self._ensure_integrations()
+        return self._data_manager
+    
+    @property
+    def file_processor(self):
+        self._ensure_integrations()
+        return self._file_processor
+    
+    @property
+    def security_handler(self):
+        self._ensure_integrations()
+        return self._security_handler
+    
     def _discover_metrics(self):
         """Automatically discover all metric modules"""
         # Get the absolute path to the metrics directory
@@ -62,67 +172,70 @@ class MetricRegistry:
         parent_dir = current_file.parent.parent  # Go up to src/
         metrics_dir = parent_dir / 'metrics'
         
-        for persona in ['cfo', 'cio', 'cto', 'pm']:
+        # Reuse the last scan while no persona directory has gained, lost or renamed files
+        mtimes = _persona_dir_mtimes(metrics_dir)
+        discovered = _load_discovery_cache(metrics_dir, mtimes)
+        if discovered is None:
+            discovered = self._scan_metrics(metrics_dir)
+            _save_discovery_cache(metrics_dir, mtimes, discovered)
+        
+        for persona, persona_metrics in discovered.items():
+            for metric_name, (module_file, script_file, csv_file) in persona_metrics.items():
+                self.metrics[persona][metric_name] = {
+                    'module_path': module_file,
+                    'script_path': script_file,
+                    'data_path': csv_file,
+                    'module': None,  # Will be loaded on demand
+                    'data': None,    # Will be loaded on demand
+                    'live_data_available': False,  # Will be updated based on data sources
+                    'last_updated': None
+                }
+        
+        logger.info(f"Discovered metrics: {sum(len(persona_metrics) for persona_metrics in self.metrics.values())}")
+    
+    def _scan_metrics(self, metrics_dir: Path) -> Dict[str, Dict[str, Tuple[Path, Optional[Path], Optional[Path]]]]:
+        """Walk the persona directories for metric modules and their script/CSV companions"""
+        discovered = {persona: {} for persona in self.metrics}
+        
+        for persona in METRIC_PERSONAS:
             persona_path = metrics_dir / persona
-            if persona_path.exists():
-                # Find all module files
-                module_files = list(persona_path.glob('*_module.py'))
-                
-                for module_file in module_files:
-                    # Remove the persona prefix if it exists for the metric name
-                    metric_name = module_file.stem.replace('_module', '')
-                    if metric_name.startswith(f'{persona}_'):
-                        metric_name = metric_name[len(f'{persona}_'):]
-                    
-                    # Check for corresponding files - handle space in filename
-                    script_file = persona_path / f"{metric_name} script.py"
-                    csv_file = persona_path / f"{metric_name}_examples.csv"
-                    
-                    # If script file with space doesn't exist, try without space
-                    if not script_file.exists():
-                        script_file = persona_path / f"{metric_name}_script.py"
-                    
-                    # Also try with persona prefix
-                    if not csv_file.exists():
-                        csv_file = persona_path / f"{persona}_{metric_name}_examples.csv"
-                    
-                    self.metrics[persona][metric_name] = {
-                        'module_path': module_file,
-                        'script_path': script_file if script_file.exists() else None,
-                        'data_path': csv_file if csv_file.exists() else None,
-                        'module': None,  # Will be loaded on demand
-                        'data': None,    # Will be loaded on demand
-                        'live_data_available': False,  # Will be updated based on data sources
-                        'last_updated': None
-                    }
-        
-        # Handle HBCU metrics in separate folder
-        hbcu_path = parent_dir / 'metrics' / 'hbcu'
-        if hbcu_path.exists():
-            module_files = list(hbcu_path.glob('*_module.py'))
             
-            for module_file in module_files:
-                metric_name = module_file.stem.replace('_module', '')
+            # One directory listing per persona; companion files are set lookups, not stat calls
+            try:
+                with os.scandir(persona_path) as it:
+                    names = [entry.name for entry in it]
+            except OSError:
+                continue
+            entries = set(names)
+            
+            # Find all module files (in directory order, as glob returned them)
+            for module_name in (name for name in names if name.endswith('_module.py') and not name.startswith('.')):
+                metric_name = module_name[:-len('.py')].replace('_module', '')
+                
+                # Remove the persona prefix if it exists for the metric name
+                # (HBCU metrics live in their own folder and keep their full names)
+                if persona != 'hbcu' and metric_name.startswith(f'{persona}_'):
+                    metric_name = metric_name[len(f'{persona}_'):]
                 
                 # Check for corresponding files - handle space in filename
-                script_file = hbcu_path / f"{metric_name} script.py"
-                csv_file = hbcu_path / f"{metric_name}_examples.csv"
+                script_name = f"{metric_name} script.py"
+                csv_name = f"{metric_name}_examples.csv"
                 
                 # If script file with space doesn't exist, try without space
-                if not script_file.exists():
-                    script_file = hbcu_path / f"{metric_name}_script.py"
+                if script_name not in entries:
+                    script_name = f"{metric_name}_script.py"
                 
-                self.metrics['hbcu'][metric_name] = {
-                    'module_path': module_file,
-                    'script_path': script_file if script_file.exists() else None,
-                    'data_path': csv_file if csv_file.exists() else None,
-                    'module': None,
-                    'data': None,
-                    'live_data_available': False,
-                    'last_updated': None
-                }
+                # Also try with persona prefix
+                if persona != 'hbcu' and csv_name not in entries:
+                    csv_name = f"{persona}_{metric_name}_examples.csv"
+                
+                discovered[persona][metric_name] = (
+                    persona_path / module_name,
+                    persona_path / script_name if script_name in entries else None,
+                    persona_path / csv_name if csv_name in entries else None
+                )
         
-        logger.info(f"Discovered metrics: {sum(len(persona_metrics) for persona_metrics in self.metrics.values())}")
+        return discovered
     
     def register_data_source(self, name: str, connector):
         """Register a data source connector"""
@@ -130,7 +243,7 @@ class MetricRegistry:
             self.data_manager.register_connector(name, connector)
             logger.info(f"Registered data source: {name}")
     
-    def get_live_data(self, persona: str, metric_name: str) -> Optional[pd.DataFrame]:
+    def get_live_data(self, persona: str, metric_name: str) -> Optional["pd.DataFrame"]:
         """Get live data from integrated sources"""
         
         if not self.data_manager:
@@ -159,25 +272,9 @@ class MetricRegistry:
         if metric_name not in self.metrics[persona]:
             return None
         
-        metric_info = self.metrics[persona][metric_name]
-        
-        if metric_info['module'] is None and metric_info['module_path']:
-            try:
-                # Dynamic import of the module
-                spec = importlib.util.spec_from_file_location(
-                    f"{persona}.{metric_name}_module",
-                    metric_info['module_path']
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                metric_info['module'] = module
-            except Exception as e:
-                logger.error(f"Error loading module {metric_name}: {e}")
-                return None
-        
-        return metric_info['module']
+        return self._load_module(persona, metric_name, self.metrics[persona][metric_name])
     
-    def load_metric_data(self, persona: str, metric_name: str, prefer_live: bool = True) -> Optional[pd.DataFrame]:
+    def load_metric_data(self, persona: str, metric_name: str, prefer_live: bool = True) -> Optional["pd.DataFrame"]:
         """
         Load metric data from live sources or CSV files
         
@@ -193,8 +290,47 @@ class MetricRegistry:
         if metric_name not in self.metrics[persona]:
             return None
         
-        metric_info = self.metrics[persona][metric_name]
+        return self._load_data(persona, metric_name, self.metrics[persona][metric_name], prefer_live)
+    
+    def load(self, persona: str, metric_name: str, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
+        """Load a metric's data and module together from a single registry lookup
         
+        Returns:
+            (data, module), or (None, None) for an unknown persona or metric
+        """
+        metric_info = self.metrics.get(persona, {}).get(metric_name)
+        if metric_info is None:
+            return None, None
+        
+        return (self._load_data(persona, metric_name, metric_info, prefer_live),
+                self._load_module(persona, metric_name, metric_info))
+    
+    def _load_module(self, persona: str, metric_name: str, metric_info: Dict[str, Any]):
+        """Module for an already looked-up metric, executing it on first use"""
+        if metric_info['module'] is None and metric_info['module_path']:
+            # Modules are executed once per process and shared by every registry
+            key = str(metric_info['module_path'])
+            module = _MODULE_CACHE.get(key)
+            if module is None:
+                module_name = f"{persona}.{metric_name}_module"
+                try:
+                    # Dynamic import of the module
+                    spec = importlib.util.spec_from_file_location(module_name, metric_info['module_path'])
+                    module = importlib.util.module_from_spec(spec)
+                    sys.modules[module_name] = module
+                    spec.loader.exec_module(module)
+                except Exception as e:
+                    sys.modules.pop(module_name, None)
+                    logger.error(f"Error loading module {metric_name}: {e}")
+                    return None
+                _MODULE_CACHE[key] = module
+            metric_info['module'] = module
+        
+        return metric_info['module']
+    
+    def _load_data(self, persona: str, metric_name: str, metric_info: Dict[str, Any],
+                   prefer_live: bool) -> Optional["pd.DataFrame"]:
+        """Data for an already looked-up metric: live if preferred and available, else its CSV"""
         # Try live data first if preferred and available
         if prefer_live and self.data_manager:
             live_data = self.get_live_data(persona, metric_name)
@@ -205,7 +341,9 @@ class MetricRegistry:
         # Fall back to cached data or CSV file
         if metric_info['data'] is None and metric_info['data_path']:
             try:
-                metric_info['data'] = pd.read_csv(metric_info['data_path'])
+                data_path = metric_info['data_path']
+                # Copy so callers that add or convert columns never touch the shared parse
+                metric_info['data'] = _read_csv_cached(str(data_path), data_path.stat().st_mtime_ns).copy()
                 logger.info(f"Loaded CSV data for {persona}.{metric_name}")
             except Exception as e:
                 logger.error(f"Error loading data for {metric_name}: {e}")
@@ -257,7 +395,7 @@ class MetricRegistry:
         
         catalog = {
             'generated_at': datetime.now().isoformat(),
-            'data_integration_available': DATA_INTEGRATION_AVAILABLE,
+            'data_integration_available': self._ensure_integrations(),
             'total_metrics': sum(len(persona_metrics) for persona_metrics in self.metrics.values()),
             'personas': {}
         }
@@ -277,7 +415,6 @@ class MetricRegistry:
                     'last_updated': metric_info['last_updated']
                 }
         
-        import json
         with open(output_path, 'w') as f:
             json.dump(catalog, f, indent=2)
         
@@ -291,50 +428,40 @@ class CFOMetrics:
     def __init__(self, registry: MetricRegistry):
         self.registry = registry
     
-    def get_budget_variance_data(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_budget_variance_data(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load and process budget variance data"""
         
         # Try with full name first, then without prefix
         for metric_name in ['cfo_budget_vs_actual', 'budget_vs_actual']:
-            data = self.registry.load_metric_data('cfo', metric_name, prefer_live)
+            data, module = self.registry.load('cfo', metric_name, prefer_live)
             if data is not None:
                 break
         else:
             return None, None
         
-        module = self.registry.load_metric_module('cfo', metric_name)
-        
         if data is not None:
             # Add any additional processing
             if 'Variance Amount' in data.columns:
-                data['Variance Amount'] = pd.to_numeric(data['Variance Amount'], errors='coerce')
+                data['Variance Amount'] = _pd().to_numeric(data['Variance Amount'], errors='coerce')
             if 'Variance %' in data.columns:
-                # Handle percentage values that might be strings
-                if data['Variance %'].dtype == 'object':
-                    # Remove % sign and convert to float
-                    data['Variance %'] = data['Variance %'].str.rstrip('%').astype(float)
-                else:
-                    data['Variance %'] = pd.to_numeric(data['Variance %'], errors='coerce')
+                # Handle percentage values that might be strings: strip the % sign,
+                # then convert the whole column in one coercing pass
+                variance_pct = data['Variance %']
+                if variance_pct.dtype == 'object' or _pd().api.types.is_string_dtype(variance_pct):
+                    variance_pct = variance_pct.str.rstrip('%')
+                data['Variance %'] = _pd().to_numeric(variance_pct, errors='coerce')
         
         return data, module
     
-    def get_contract_alerts(self, days_threshold: int = 90, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_contract_alerts(self, days_threshold: int = 90, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load and process contract expiration alerts"""
         
-        # Try live data first if available
-        if prefer_live:
-            live_data = self.registry.get_live_data('cfo', 'contract_expiration_alerts')
-            if live_data is not None and not live_data.empty:
-                data = live_data
-            else:
-                # Fall back to static data
-                data = self.registry.load_metric_data('cfo', 'contract_expiration_alerts', prefer_live=False)
-        else:
-            data = self.registry.load_metric_data('cfo', 'contract_expiration_alerts', prefer_live=False)
-        
-        module = self.registry.load_metric_module('cfo', 'contract_expiration_alerts')
+        # Live data first if preferred and available, falling back to static data
+        data, module = self.registry.load('cfo', 'contract_expiration_alerts', prefer_live)
         
         if data is not None:
+            pd = _pd()
+            
             # Process dates
             if 'Contract End Date' in data.columns:
                 data['Contract End Date'] = pd.to_datetime(data['Contract End Date'], errors='coerce')
@@ -346,26 +473,27 @@ class CFOMetrics:
                     today = pd.Timestamp.now()
                     data['Days Until Expiry'] = (data['Contract End Date'] - today).dt.days
             
-            # Add alert status
+            # Add alert status (first matching condition wins, as np.select evaluates in order)
             if 'Days Until Expiry' in data.columns:
-                data['Alert Status'] = data['Days Until Expiry'].apply(
-                    lambda x: 'Critical' if pd.notna(x) and x < 30 
-                             else 'Warning' if pd.notna(x) and x < days_threshold 
-                             else 'OK' if pd.notna(x) 
-                             else 'Unknown'
+                import numpy as np
+                
+                days = data['Days Until Expiry']
+                data['Alert Status'] = np.select(
+                    [days.isna(), days < 30, days < days_threshold],
+                    ['Unknown', 'Critical', 'Warning'],
+                    default='OK'
                 )
         
         return data, module
     
-    def get_grant_compliance_data(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_grant_compliance_data(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load and process grant compliance data"""
-        data = self.registry.load_metric_data('cfo', 'grant_compliance', prefer_live)
-        module = self.registry.load_metric_module('cfo', 'grant_compliance')
+        data, module = self.registry.load('cfo', 'grant_compliance', prefer_live)
         
         if data is not None:
             # Process compliance rate
             if 'Compliance Rate (%)' in data.columns:
-                data['Compliance Rate (%)'] = pd.to_numeric(data['Compliance Rate (%)'], errors='coerce')
+                data['Compliance Rate (%)'] = _pd().to_numeric(data['Compliance Rate (%)'], errors='coerce')
             if 'Risk of Fund Clawback' in data.columns:
                 data['Risk Level'] = data['Risk of Fund Clawback']
             else:
@@ -373,16 +501,14 @@ class CFOMetrics:
         
         return data, module
     
-    def get_vendor_optimization_data(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_vendor_optimization_data(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load vendor spend optimization data"""
-        data = self.registry.load_metric_data('cfo', 'vendor_spend_optimization', prefer_live)
-        module = self.registry.load_metric_module('cfo', 'vendor_spend_optimization')
+        data, module = self.registry.load('cfo', 'vendor_spend_optimization', prefer_live)
         return data, module
     
-    def get_student_success_roi(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_student_success_roi(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load student success ROI data"""
-        data = self.registry.load_metric_data('cfo', 'student_success_roi', prefer_live)
-        module = self.registry.load_metric_module('cfo', 'student_success_roi')
+        data, module = self.registry.load('cfo', 'student_success_roi', prefer_live)
         return data, module
 
 # Similar enhanced classes for CIO, CTO, and PM metrics
@@ -392,22 +518,19 @@ class CIOMetrics:
     def __init__(self, registry: MetricRegistry):
         self.registry = registry
     
-    def get_digital_transformation_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_digital_transformation_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load digital transformation metrics"""
-        data = self.registry.load_metric_data('cio', 'digital_transformation_metrics', prefer_live)
-        module = self.registry.load_metric_module('cio', 'digital_transformation_metrics')
+        data, module = self.registry.load('cio', 'digital_transformation_metrics', prefer_live)
         return data, module
     
-    def get_business_unit_spend(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_business_unit_spend(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load business unit IT spend data"""
-        data = self.registry.load_metric_data('cio', 'business_unit_it_spend', prefer_live)
-        module = self.registry.load_metric_module('cio', 'business_unit_it_spend')
+        data, module = self.registry.load('cio', 'business_unit_it_spend', prefer_live)
         return data, module
     
-    def get_risk_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_risk_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load risk dashboard metrics"""
-        data = self.registry.load_metric_data('cio', 'risk_metrics', prefer_live)
-        module = self.registry.load_metric_module('cio', 'risk_metrics')
+        data, module = self.registry.load('cio', 'risk_metrics', prefer_live)
         return data, module
 
 class CTOMetrics:
@@ -416,22 +539,19 @@ class CTOMetrics:
     def __init__(self, registry: MetricRegistry):
         self.registry = registry
     
-    def get_cloud_optimization_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_cloud_optimization_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load cloud cost optimization metrics"""
-        data = self.registry.load_metric_data('cto', 'cloud_cost_optimization_metrics', prefer_live)
-        module = self.registry.load_metric_module('cto', 'cloud_cost_optimization_metrics')
+        data, module = self.registry.load('cto', 'cloud_cost_optimization_metrics', prefer_live)
         return data, module
     
-    def get_asset_lifecycle_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_asset_lifecycle_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load asset lifecycle management metrics"""
-        data = self.registry.load_metric_data('cto', 'asset_lifecycle_management_metrics', prefer_live)
-        module = self.registry.load_metric_module('cto', 'asset_lifecycle_management_metrics')
+        data, module = self.registry.load('cto', 'asset_lifecycle_management_metrics', prefer_live)
         return data, module
     
-    def get_security_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_security_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load security metrics and response data"""
-        data = self.registry.load_metric_data('cto', 'security_metrics_and_response', prefer_live)
-        module = self.registry.load_metric_module('cto', 'security_metrics_and_response')
+        data, module = self.registry.load('cto', 'security_metrics_and_response', prefer_live)
         return data, module
 
 class PMMetrics:
@@ -440,20 +560,18 @@ class PMMetrics:
     def __init__(self, registry: MetricRegistry):
         self.registry = registry
     
-    def get_project_charter_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_project_charter_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load project charter metrics"""
-        data = self.registry.load_metric_data('pm', 'project_charter_metrics', prefer_live)
-        module = self.registry.load_metric_module('pm', 'project_charter_metrics')
+        data, module = self.registry.load('pm', 'project_charter_metrics', prefer_live)
         return data, module
     
-    def get_raid_log_metrics(self, prefer_live: bool = True) -> Tuple[Optional[pd.DataFrame], Any]:
+    def get_raid_log_metrics(self, prefer_live: bool = True) -> Tuple[Optional["pd.DataFrame"], Any]:
         """Load RAID log metrics"""
-        data = self.registry.load_metric_data('pm', 'raid_log_metrics', prefer_live)
-        module = self.registry.load_metric_module('pm', 'raid_log_metrics')
+        data, module = self.registry.load('pm', 'raid_log_metrics', prefer_live)
         return data, module
 
 # Utility functions for metric integration
-def get_metric_summary(registry: MetricRegistry, persona: str) -> pd.DataFrame:
+def get_metric_summary(registry: MetricRegistry, persona: str) -> "pd.DataFrame":
     """Get a summary of all available metrics for a persona"""
     metrics = registry.get_available_metrics(persona)
     summary = []
@@ -469,12 +587,12 @@ def get_metric_summary(registry: MetricRegistry, persona: str) -> pd.DataFrame:
             'last_updated': info['last_updated']
         })
     
-    return pd.DataFrame(summary)
+    return _pd().DataFrame(summary)
 
 def setup_data_sources(registry: MetricRegistry, config: Dict[str, Any]):
     """Setup data sources based on configuration"""
     
-    if not DATA_INTEGRATION_AVAILABLE:
+    if not registry._ensure_integrations():
         logger.warning("Data integration not available")
         return
     
@@ -501,11 +619,48 @@ def setup_data_sources(registry: MetricRegistry, config: Dict[str, Any]):
         )
         registry.register_data_source('Paycom', paycom_connector)
 
-# Initialize the enhanced registry when imported
-metric_registry = MetricRegistry()
-cfo_metrics = CFOMetrics(metric_registry)
-cio_metrics = CIOMetrics(metric_registry)
-cto_metrics = CTOMetrics(metric_registry)
-pm_metrics = PMMetrics(metric_registry)
+# Shared registry, built on first use rather than at import so importing this module
+# does not walk the metrics directories
+@lru_cache(maxsize=1)
+def get_registry() -> MetricRegistry:
+    """Process-wide MetricRegistry"""
+    registry = MetricRegistry()
+    logger.info("Enhanced metric registry initialized with data source integration")
+    return registry
+
+@lru_cache(maxsize=1)
+def get_cfo_metrics() -> CFOMetrics:
+    """CFO metric handlers over the shared registry"""
+    return CFOMetrics(get_registry())
+
+@lru_cache(maxsize=1)
+def get_cio_metrics() -> CIOMetrics:
+    """CIO metric handlers over the shared registry"""
+    return CIOMetrics(get_registry())
+
+@lru_cache(maxsize=1)
+def get_cto_metrics() -> CTOMetrics:
+    """CTO metric handlers over the shared registry"""
+    return CTOMetrics(get_registry())
+
+@lru_cache(maxsize=1)
+def get_pm_metrics() -> PMMetrics:
+    """PM metric handlers over the shared registry"""
+    return PMMetrics(get_registry())
+
+_LAZY_SINGLETONS = {
+    'metric_registry': get_registry,
+    'cfo_metrics': get_cfo_metrics,
+    'cio_metrics': get_cio_metrics,
+    'cto_metrics': get_cto_metrics,
+    'pm_metrics': get_pm_metrics
+}
 
-logger.info("Enhanced metric registry initialized with data source integration")
\ No newline at end of file
+def __getattr__(name: str):
+    """Keep `from metric_registry import metric_registry, cfo_metrics, ...` working lazily"""
+    if name == 'DATA_INTEGRATION_AVAILABLE':
+        return _integration_classes() is not None
+    factory = _LAZY_SINGLETONS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
@@ -6,16 +6,22 @@ st.set_page_config(
     layout="wide"
 )
 
-st.title("🎓 Paul Quinn College IT Analytics Suite")
-st.markdown("### Welcome to Your IT Intelligence Platform")
+# Title, welcome text and notices as one static HTML block (one element per rerun instead of four)
+LANDING_HTML = """
+<h1>🎓 Paul Quinn College IT Analytics Suite</h1>
+<h3>Welcome to Your IT Intelligence Platform</h3>
+<div style="background-color: rgba(28, 131, 225, 0.1); color: #004280; padding: 16px; border-radius: 8px; margin: 16px 0;">
+<strong>Available Dashboards:</strong>
+<p>Deploy each dashboard separately for now:</p>
+<ul>
+<li><a href="https://your-app.streamlit.app">Executive Dashboard</a> - Deploy using <code>it_dashboard_app.py</code></li>
+<li><a href="https://your-app2.streamlit.app">Modern Style</a> - Deploy using <code>03_Code/dashboard_modern.py</code></li>
+<li><a href="https://your-app3.streamlit.app">Usage &amp; ROI</a> - Deploy using <code>03_Code/usage_roi_dashboard_fixed.py</code></li>
+</ul>
+</div>
+<div style="background-color: rgba(33, 195, 84, 0.1); color: #177233; padding: 16px; border-radius: 8px; margin: 16px 0;">
+For now, please deploy each dashboard as a separate app!
+</div>
+"""
 
-st.info("""
-**Available Dashboards:**
-
-Deploy each dashboard separately for now:
-- [Executive Dashboard](https://your-app.streamlit.app) - Deploy using `it_dashboard_app.py`
-- [Modern Style](https://your-app2.streamlit.app) - Deploy using `03_Code/dashboard_modern.py`
-- [Usage & ROI](https://your-app3.streamlit.app) - Deploy using `03_Code/usage_roi_dashboard_fixed.py`
-""")
-
-st.success("For now, please deploy each dashboard as a separate app!")
+st.markdown(LANDING_HTML, unsafe_allow_html=True)